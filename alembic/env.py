@@ -67,6 +67,13 @@ def import_all_models():
 import_all_models()
 
 
+def include_object(object, name, type_, reflected, compare_to):
+    """Leave the pg_trgm indexes out of autogenerate, they only exist in the migrations."""
+    if type_ == "index" and reflected and name.endswith("_trgm"):
+        return False
+    return True
+
+
 def run_migrations_offline() -> None:
     """
     Run migrations in 'offline' mode.
@@ -84,6 +91,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -107,7 +115,11 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object,
+        )
 
         with context.begin_transaction():
             context.run_migrations()
@@ -0,0 +1,27 @@
+"""user status counts version
+
+Revision ID: 3a9d5e7f1b24
+Revises: b6f28d41c7e5
+Create Date: 2026-10-18 23:48:19.574031
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3a9d5e7f1b24'
+down_revision: Union[str, None] = 'b6f28d41c7e5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Write marker of the users list ETag, bumped in the transaction of every user write
+    op.add_column('user_status_counts', sa.Column('version', sa.BigInteger(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('user_status_counts', 'version')
@@ -0,0 +1,35 @@
+"""add user status counts
+
+Revision ID: 457bdb7d47b4
+Revises: 0ab43e474275
+Create Date: 2026-10-18 09:12:41.283114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '457bdb7d47b4'
+down_revision: Union[str, None] = '0ab43e474275'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('user_status_counts',
+    sa.Column('status', sa.String(), nullable=False),
+    sa.Column('total', sa.BigInteger(), server_default='0', nullable=False),
+    sa.PrimaryKeyConstraint('status')
+    )
+    # Backfill the counters from the existing users
+    op.execute(
+        "insert into user_status_counts (status, total) "
+        "select status, count(*) from users where status is not null group by status"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('user_status_counts')
@@ -0,0 +1,31 @@
+"""users search lower indexes
+
+Revision ID: 5d7e0b3c9a12
+Revises: e83a61f0d2c4
+Create Date: 2026-10-18 21:40:52.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d7e0b3c9a12'
+down_revision: Union[str, None] = 'e83a61f0d2c4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # btree indexes of the search exact and prefix matches, lower(column) = / LIKE 'q%'
+    with op.get_context().autocommit_block():
+        op.create_index('ix_users_name_lower', 'users', [sa.text('lower(name) text_pattern_ops')], unique=False, postgresql_where=sa.text('deleted_at IS NULL'), postgresql_concurrently=True)
+        op.create_index('ix_users_email_lower', 'users', [sa.text('lower(email) text_pattern_ops')], unique=False, postgresql_where=sa.text('deleted_at IS NULL'), postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_users_email_lower', table_name='users', postgresql_concurrently=True)
+        op.drop_index('ix_users_name_lower', table_name='users', postgresql_concurrently=True)
@@ -0,0 +1,35 @@
+"""users soft delete partial indexes
+
+Revision ID: 9c1f4e2a7b3d
+Revises: 457bdb7d47b4
+Create Date: 2026-10-18 14:05:27.519204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c1f4e2a7b3d'
+down_revision: Union[str, None] = '457bdb7d47b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Built concurrently so writes to users are not blocked while the indexes build
+    with op.get_context().autocommit_block():
+        op.create_index('ix_users_email_active', 'users', ['email'], unique=True, postgresql_where=sa.text('deleted_at IS NULL'), postgresql_concurrently=True)
+        op.create_index('ix_users_status_active', 'users', ['status'], unique=False, postgresql_where=sa.text('deleted_at IS NULL'), postgresql_concurrently=True)
+        op.create_index('ix_users_deleted_at', 'users', ['deleted_at'], unique=False, postgresql_where=sa.text('deleted_at IS NOT NULL'), postgresql_concurrently=True)
+        op.drop_index('ix_users_email', table_name='users', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('ix_users_email', 'users', ['email'], unique=True, postgresql_concurrently=True)
+        op.drop_index('ix_users_deleted_at', table_name='users', postgresql_concurrently=True)
+        op.drop_index('ix_users_status_active', table_name='users', postgresql_concurrently=True)
+        op.drop_index('ix_users_email_active', table_name='users', postgresql_concurrently=True)
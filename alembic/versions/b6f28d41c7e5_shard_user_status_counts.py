@@ -0,0 +1,42 @@
+"""shard user status counts
+
+Revision ID: b6f28d41c7e5
+Revises: 5d7e0b3c9a12
+Create Date: 2026-10-18 23:05:37.902615
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6f28d41c7e5'
+down_revision: Union[str, None] = '5d7e0b3c9a12'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The existing counters become shard 0 of their status
+    op.add_column('user_status_counts', sa.Column('shard', sa.SmallInteger(), server_default='0', nullable=False))
+    op.drop_constraint('user_status_counts_pkey', 'user_status_counts', type_='primary')
+    op.create_primary_key('user_status_counts_pkey', 'user_status_counts', ['status', 'shard'])
+
+
+def downgrade() -> None:
+    # Fold the shards back into one row per status
+    op.execute(
+        "update user_status_counts c set total = s.total from ("
+        "select status, min(shard) as shard, sum(total) as total "
+        "from user_status_counts group by status"
+        ") s where c.status = s.status and c.shard = s.shard"
+    )
+    op.execute(
+        "delete from user_status_counts c using user_status_counts s "
+        "where c.status = s.status and c.shard > s.shard"
+    )
+    op.drop_constraint('user_status_counts_pkey', 'user_status_counts', type_='primary')
+    op.drop_column('user_status_counts', 'shard')
+    op.create_primary_key('user_status_counts_pkey', 'user_status_counts', ['status'])
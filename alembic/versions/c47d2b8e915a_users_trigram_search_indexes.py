@@ -0,0 +1,32 @@
+"""users trigram search indexes
+
+Revision ID: c47d2b8e915a
+Revises: 9c1f4e2a7b3d
+Create Date: 2026-10-18 16:21:48.902331
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c47d2b8e915a'
+down_revision: Union[str, None] = '9c1f4e2a7b3d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    # GIN trigram indexes serve ILIKE '%q%' on name and email, built without blocking writes
+    with op.get_context().autocommit_block():
+        op.create_index('ix_users_name_trgm', 'users', ['name'], unique=False, postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}, postgresql_where=sa.text('deleted_at IS NULL'), postgresql_concurrently=True)
+        op.create_index('ix_users_email_trgm', 'users', ['email'], unique=False, postgresql_using='gin', postgresql_ops={'email': 'gin_trgm_ops'}, postgresql_where=sa.text('deleted_at IS NULL'), postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_users_email_trgm', table_name='users', postgresql_concurrently=True)
+        op.drop_index('ix_users_name_trgm', table_name='users', postgresql_concurrently=True)
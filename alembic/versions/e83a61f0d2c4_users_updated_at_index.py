@@ -0,0 +1,28 @@
+"""users updated_at index
+
+Revision ID: e83a61f0d2c4
+Revises: c47d2b8e915a
+Create Date: 2026-10-18 18:02:13.440716
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e83a61f0d2c4'
+down_revision: Union[str, None] = 'c47d2b8e915a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('ix_users_updated_at_active', 'users', ['updated_at'], unique=False, postgresql_where=sa.text('deleted_at IS NULL'), postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_users_updated_at_active', table_name='users', postgresql_concurrently=True)
@@ -0,0 +1,47 @@
+from fastapi import APIRouter, status
+from fastapi.responses import JSONResponse
+
+from app.lib.cache import user_cache
+from app.lib.database import async_engine, engine, replica_set
+from app.lib.db_pool import pool_status
+from app.lib.password_hasher import password_hasher
+from app.lib.token_cache import token_cache
+
+# Create a api router
+router = APIRouter(prefix="/metrics")
+
+
+# Database connection pool metrics route
+@router.get("/db-pool")
+async def db_pool_metrics() -> JSONResponse:
+    """Get connection pool state, checkout wait times and failures."""
+    data = {
+        "async": pool_status(async_engine),
+        "sync": pool_status(engine),
+        "replicas": [
+            {**health, **pool_status(replica.engine)}
+            for health, replica in zip(replica_set.status(), replica_set.replicas, strict=True)
+        ],
+    }
+    return JSONResponse(content=data, status_code=status.HTTP_200_OK)
+
+
+# Password hasher pool metrics route
+@router.get("/password-hasher")
+async def password_hasher_metrics() -> JSONResponse:
+    """Get bcrypt pool queue depth, queue/run times and rehash counts."""
+    return JSONResponse(content=password_hasher.snapshot(), status_code=status.HTTP_200_OK)
+
+
+# User cache metrics route
+@router.get("/user-cache")
+async def user_cache_metrics() -> JSONResponse:
+    """Get user cache size, hits, misses and evictions."""
+    return JSONResponse(content=user_cache.snapshot(), status_code=status.HTTP_200_OK)
+
+
+# Verified JWT cache metrics route
+@router.get("/token-cache")
+async def token_cache_metrics() -> JSONResponse:
+    """Get verified token cache size, hit rate, expirations and revocations."""
+    return JSONResponse(content=token_cache.snapshot(), status_code=status.HTTP_200_OK)
@@ -1,14 +1,18 @@
 from __future__ import annotations
 from typing import Any
-from fastapi import APIRouter, Request, status, Depends, BackgroundTasks, UploadFile
-from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Request, Response, status, Depends, BackgroundTasks, UploadFile
+from fastapi.responses import StreamingResponse
+from fastapi_pundra.rest.exceptions import BadRequestException
 from fastapi_pundra.rest.helpers import the_query
 from fastapi_pundra.rest.validation import dto
 from fastapi_pundra.rest.openapi import openapi_request_body_schema
-from sqlalchemy.orm import Session
-from app.lib.database import get_db_session
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from app.config.cache import CACHE_CONTROL
+from app.lib.bulk_import import IMPORT_FORMATS, import_format, iter_lines
+from app.lib.database import get_async_db_session, get_async_session_factory
+from app.lib.etag import cache_headers, is_not_modified, not_modified_response
 from app.schemas.user_schema import (
+    UserBatchSchema,
     UserCreateSchema,
     UserUpdateSchema,
     UserLoginSchema,
@@ -22,12 +26,21 @@ router = APIRouter(prefix="/api/v1", tags=["User"])
 # User service
 user_service = UserService()
 
+# Content types of the user export formats
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
 
 # Registration route
-@router.post("/users/registration", openapi_extra={**openapi_request_body_schema(UserCreateSchema)})
+@router.post(
+    "/users/registration",
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra={**openapi_request_body_schema(UserCreateSchema)},
+)
 @dto(UserCreateSchema)
 async def registration(
-    request: Request, background_tasks: BackgroundTasks, db: Session = Depends(get_db_session)
+    request: Request,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_async_db_session),
 ) -> dict[str, Any]:
     """Register a new user."""
     # Retrieve data from the request
@@ -35,31 +48,108 @@ async def registration(
     data = UserCreateSchema(**request_data)
 
     output = await user_service.s_registration(request, db, data, background_tasks)
-    return JSONResponse(content=output, status_code=status.HTTP_201_CREATED)
+    return output
 
 
 @router.post("/users/login", openapi_extra={**openapi_request_body_schema(UserLoginSchema)})
 @dto(UserLoginSchema)
-async def login(request: Request, db: Session = Depends(get_db_session)) -> JSONResponse:
+async def login(
+    request: Request, db: AsyncSession = Depends(get_async_db_session)
+) -> dict[str, Any]:
     """Login a user."""
     output = await user_service.s_login(request, db)
-    return JSONResponse(content=jsonable_encoder(output), status_code=status.HTTP_200_OK)
+    return output
+
+
+@router.post("/users/import")
+async def import_users(
+    request: Request, db: AsyncSession = Depends(get_async_db_session)
+) -> dict[str, Any]:
+    """
+    Bulk import users from a CSV (with a header line) or NDJSON request body.
+
+    The format comes from ``?format=csv|ndjson`` or the content type, ``?on_conflict=update``
+    updates the name and password of already registered emails instead of reporting them.
+    """
+    the_format = request.query_params.get("format") or import_format(
+        request.headers.get("content-type")
+    )
+    if the_format not in IMPORT_FORMATS:
+        raise BadRequestException(message=f"Unsupported import format: {the_format}")
+
+    output = await user_service.s_import_users(
+        db,
+        iter_lines(request.stream()),
+        the_format,
+        update_existing=request.query_params.get("on_conflict") == "update",
+    )
+    return output
 
 
 @router.get("/users")
-async def get_users(request: Request, db: Session = Depends(get_db_session)) -> JSONResponse:
+async def get_users(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db_session),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_async_session_factory),
+) -> dict[str, Any]:
     """Get all users."""
-    output = await user_service.s_get_users(request, db)
-    return JSONResponse(content=jsonable_encoder(output), status_code=status.HTTP_200_OK)
+    cache_control = CACHE_CONTROL["users.list"]
+    etag = await user_service.s_get_users_etag(request, db)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag, cache_control)
+
+    output = await user_service.s_get_users(request, db, session_factory=session_factory)
+    response.headers.update(cache_headers(etag, cache_control))
+    return output
+
+
+@router.post("/users/batch", openapi_extra={**openapi_request_body_schema(UserBatchSchema)})
+@dto(UserBatchSchema)
+async def get_users_by_ids(
+    request: Request, db: AsyncSession = Depends(get_async_db_session)
+) -> dict[str, Any]:
+    """Get up to ``USER_BATCH_MAX_IDS`` users by id, in request order."""
+    data: UserBatchSchema = request.state.validated_data
+    output = await user_service.s_get_users_by_ids(request, db, [str(i) for i in data.ids])
+    return output
+
+
+@router.get("/users/export")
+async def export_users(
+    request: Request,
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_async_session_factory),
+) -> StreamingResponse:
+    """Stream every user as NDJSON (default) or CSV with ``?format=csv``."""
+    the_format = request.query_params.get("format", "ndjson")
+    if the_format not in EXPORT_MEDIA_TYPES:
+        raise BadRequestException(message=f"Unsupported export format: {the_format}")
+
+    return StreamingResponse(
+        user_service.s_export_users(session_factory, the_format),
+        media_type=EXPORT_MEDIA_TYPES[the_format],
+        headers={"Content-Disposition": f'attachment; filename="users.{the_format}"'},
+    )
 
 
 @router.get("/users/{user_id}")
 async def get_user(
-    request: Request, user_id: int | str, db: Session = Depends(get_db_session)
-) -> JSONResponse:
-    """Get a user by id."""
-    output = await user_service.s_get_user_by_id(request, db, user_id=user_id)
-    return JSONResponse(content=jsonable_encoder(output), status_code=status.HTTP_200_OK)
+    request: Request,
+    response: Response,
+    user_id: int | str,
+    fields: str | None = None,
+    db: AsyncSession = Depends(get_async_db_session),
+) -> dict[str, Any]:
+    """Get a user by id, only the comma separated ``fields`` when given."""
+    cache_control = CACHE_CONTROL["users.detail"]
+    etag = await user_service.s_get_user_etag(request, db, user_id=user_id, fields=fields)
+    if etag is not None and is_not_modified(request, etag):
+        return not_modified_response(etag, cache_control)
+
+    output = await user_service.s_get_user_by_id(request, db, user_id=user_id, fields=fields)
+    if etag is not None:
+        response.headers.update(cache_headers(etag, cache_control))
+    return output
 
 
 @router.put(
@@ -67,7 +157,7 @@ async def get_user(
 )
 @dto(UserUpdateSchema)
 async def update_user(
-    request: Request, user_id: int | str, db: Session = Depends(get_db_session)
+    request: Request, user_id: int | str, db: AsyncSession = Depends(get_async_db_session)
 ) -> dict[str, Any]:
     """
     Update a user by id.
@@ -78,16 +168,16 @@ async def update_user(
     # data = request.state.validated_data
 
     output = await user_service.s_update_user(request, db, user_id=user_id)
-    return JSONResponse(content=jsonable_encoder(output), status_code=status.HTTP_200_OK)
+    return output
 
 
 @router.delete("/users/{user_id}/delete")
 async def delete_user(
-    request: Request, user_id: int | str, db: Session = Depends(get_db_session)
-) -> JSONResponse:
+    request: Request, user_id: int | str, db: AsyncSession = Depends(get_async_db_session)
+) -> dict[str, Any]:
     """Delete a user by id."""
     output = await user_service.s_delete_user(request, db, user_id=user_id)
-    return JSONResponse(content=jsonable_encoder(output), status_code=status.HTTP_200_OK)
+    return output
 
 
 @router.post(
@@ -95,8 +185,8 @@ async def delete_user(
 )
 @dto(UserProfileImageSchema)
 async def update_user_profile_image(
-    request: Request, db: Session = Depends(get_db_session)
-) -> JSONResponse:
+    request: Request, db: AsyncSession = Depends(get_async_db_session)
+) -> dict[str, Any]:
     """Update a user's profile image."""
     # Retrieve data from the request
     request_data = await the_query(request)
@@ -110,22 +200,22 @@ async def update_user_profile_image(
         "profile_image_content_type": profile_image.content_type,
         "profile_image_size": profile_image.size,
     }
-    return JSONResponse(content=jsonable_encoder(output), status_code=status.HTTP_200_OK)
+    return output
 
 
 @router.get("/users/raw-sql/users")
 async def raw_sql_get_users(
-    request: Request, db: Session = Depends(get_db_session)
-) -> JSONResponse:
+    request: Request, db: AsyncSession = Depends(get_async_db_session)
+) -> dict[str, Any]:
     """Get users using raw SQL."""
     output = await user_service.s_raw_sql_get_users(request, db)
-    return JSONResponse(content=jsonable_encoder(output), status_code=status.HTTP_200_OK)
+    return output
 
 
 @router.get("/users/raw-sql/users/{user_id}")
 async def raw_sql_get_user_by_id(
-    request: Request, user_id: str, db: Session = Depends(get_db_session)
-) -> JSONResponse:
+    request: Request, user_id: str, db: AsyncSession = Depends(get_async_db_session)
+) -> dict[str, Any]:
     """Get user by id using raw SQL."""
     output = await user_service.s_raw_sql_get_user_by_id(request, db, user_id=user_id)
-    return JSONResponse(content=jsonable_encoder(output), status_code=status.HTTP_200_OK)
+    return output
@@ -0,0 +1,19 @@
+from typing import Any
+
+from fastapi import APIRouter, Response
+
+from app.lib.jwt_keys import jwks
+from app.lib.path_exclusions import public
+
+# Create a api router
+router = APIRouter(prefix="/.well-known")
+
+
+# Public keys that verify the access tokens
+@router.get("/jwks.json")
+@public
+async def jwks_json(response: Response) -> dict[str, Any]:
+    """Get the JSON Web Key Set of the token signing keys."""
+    # Keys only change on rotation (a deploy), verifiers can keep them for a while
+    response.headers["Cache-Control"] = "public, max-age=300"
+    return jwks()
@@ -1,5 +1,7 @@
 """CLI commands for the FastAPI template project."""
 
+import asyncio
+import json
 import subprocess
 import sys
 from pathlib import Path
@@ -73,5 +75,46 @@ def upgrade() -> None:
         sys.exit(1)
 
 
+async def _import_users(path: Path, *, update_existing: bool) -> dict:
+    """Stream a file into the user bulk import."""
+    from app.lib.bulk_import import import_format  # noqa: PLC0415
+    from app.lib.database import AsyncSessionLocal  # noqa: PLC0415
+    from app.services.user_service import UserService  # noqa: PLC0415
+
+    async def read_lines() -> object:
+        with path.open(encoding="utf-8") as file:
+            for line in file:
+                yield line.rstrip("\r\n")
+
+    async with AsyncSessionLocal() as db:
+        return await UserService().s_import_users(
+            db,
+            read_lines(),
+            import_format(None, path.name),
+            update_existing=update_existing,
+        )
+
+
+def import_users() -> None:
+    """Bulk import users from a CSV (with a header line) or NDJSON file."""
+    if len(sys.argv) < MIN_ARGS_REQUIRED:
+        print("ERROR: import file required")  # noqa: T201
+        print("Usage: import-users users.csv [--update]")  # noqa: T201
+        sys.exit(1)
+
+    path = Path(sys.argv[1])
+    if not path.is_file():
+        print(f"ERROR: file not found: {path}", file=sys.stderr)  # noqa: T201
+        sys.exit(1)
+
+    print(f"Importing users from {path}...")  # noqa: T201
+    report = asyncio.run(_import_users(path, update_existing="--update" in sys.argv[2:]))
+    print(json.dumps({key: value for key, value in report.items() if key != "errors"}, indent=2))  # noqa: T201
+    for error in report["errors"]:
+        print(f"line {error['line']}: {error['errors']}", file=sys.stderr)  # noqa: T201
+    if report["failed"]:
+        sys.exit(1)
+
+
 if __name__ == "__main__":
     make_revision()
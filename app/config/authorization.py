@@ -9,3 +9,6 @@ EXCLUDE_PATHS = [
     "/redoc",
     "/openapi.json",
 ]
+
+# Every path under these prefixes, e.g. "/static" (also "/static/app.css")
+EXCLUDE_PATH_PREFIXES = []
@@ -0,0 +1,12 @@
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Cache-Control of the conditional GET routes, "no-cache" lets clients keep the response
+# but revalidate it with If-None-Match on every request
+CACHE_CONTROL = {
+    "users.list": os.getenv("CACHE_CONTROL_USERS_LIST", "private, no-cache"),
+    "users.detail": os.getenv("CACHE_CONTROL_USER_DETAIL", "private, no-cache"),
+}
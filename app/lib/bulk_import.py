@@ -0,0 +1,101 @@
+"""Streaming CSV/NDJSON record readers for bulk imports."""
+
+import codecs
+import csv
+import json
+from collections.abc import AsyncIterable, AsyncIterator
+
+from fastapi_pundra.rest.exceptions import BadRequestException
+from pydantic import BaseModel, ValidationError
+
+IMPORT_FORMATS = ("csv", "ndjson")
+
+
+def import_format(content_type: str | None, filename: str | None = None) -> str:
+    """Guess the import format from a content type or a file name, CSV by default."""
+    content_type = (content_type or "").lower()
+    filename = (filename or "").lower()
+    if "json" in content_type or filename.endswith((".ndjson", ".jsonl", ".json")):
+        return "ndjson"
+    return "csv"
+
+
+async def iter_lines(chunks: AsyncIterable[bytes | str]) -> AsyncIterator[str]:
+    """Split a stream of UTF-8 chunks into lines without reading it all."""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    try:
+        async for chunk in chunks:
+            buffer += decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+            *lines, buffer = buffer.split("\n")
+            for line in lines:
+                yield line.rstrip("\r")
+        buffer += decoder.decode(b"", final=True)
+    except UnicodeDecodeError as err:
+        raise BadRequestException(message="Import file must be UTF-8 encoded") from err
+
+    if buffer:
+        yield buffer.rstrip("\r")
+
+
+async def iter_records(
+    lines: AsyncIterable[str], import_format: str
+) -> AsyncIterator[tuple[int, dict | None]]:
+    """
+    Parse one record per line into ``(line_number, record)``, blank lines are skipped.
+
+    CSV input needs a header line, empty CSV fields become None. The record is None when
+    the line cannot be parsed, so the caller can report it and carry on.
+    """
+    header = None
+    line_number = 0
+    async for line in lines:
+        line_number += 1
+        if not line.strip():
+            continue
+
+        if import_format == "ndjson":
+            try:
+                record = json.loads(line)
+            except ValueError:
+                record = None
+            yield line_number, record if isinstance(record, dict) else None
+            continue
+
+        values = next(csv.reader([line]))
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        if len(values) != len(header):
+            yield line_number, None
+            continue
+        yield line_number, {key: value or None for key, value in zip(header, values, strict=True)}
+
+
+async def iter_batches(items: AsyncIterable, size: int) -> AsyncIterator[list]:
+    """Group an async stream into lists of at most ``size`` items."""
+    batch = []
+    async for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def validation_errors(
+    schema: type[BaseModel], record: dict | None
+) -> tuple[BaseModel | None, dict]:
+    """Validate a record, returning the model or the errors in the ``dto`` format."""
+    if record is None:
+        return None, {"line": ["line could not be parsed"]}
+
+    try:
+        return schema.model_validate(record), {}
+    except ValidationError as err:
+        errors = {}
+        for error in err.errors():
+            field = str(error["loc"][0]) if error["loc"] else "line"
+            errors.setdefault(field, []).append(f"{field} {error['msg']}")
+        return None, errors
@@ -0,0 +1,205 @@
+"""Two-tier read-through cache: an in-process LRU with TTL in front of optional Redis."""
+
+import asyncio
+import json
+import os
+import time
+from collections import OrderedDict
+
+import redis.asyncio as redis
+from dotenv import load_dotenv
+
+from app.lib.metrics import Counters
+from app.utils.logger import get_logger
+
+load_dotenv()
+
+logger = get_logger()
+
+# User lookups by id, the Redis tier is used when REDIS_URL is set
+USER_CACHE_ENABLED = os.getenv("USER_CACHE_ENABLED", "true").lower() == "true"
+USER_CACHE_MAX_SIZE = int(os.getenv("USER_CACHE_MAX_SIZE", "10000"))
+USER_CACHE_TTL_SECONDS = float(os.getenv("USER_CACHE_TTL_SECONDS", "60"))
+REDIS_URL = os.getenv("REDIS_URL", "")
+
+
+class LRUCache:
+    """Least recently used cache whose entries also expire after ``ttl`` seconds."""
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        """Initialize the cache."""
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, object]] = OrderedDict()
+        self.counters = Counters("hits", "misses", "evictions", "expirations")
+
+    def __len__(self) -> int:
+        """Get the number of entries, expired ones included until they are read."""
+        return len(self._entries)
+
+    def get(self, key: str) -> object | None:
+        """Get a value, None when it is missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.counters.incr("misses")
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.counters.incr("expirations")
+            self.counters.incr("misses")
+            return None
+
+        self._entries.move_to_end(key)
+        self.counters.incr("hits")
+        return value
+
+    def set(self, key: str, value: object) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.counters.incr("evictions")
+
+    def delete(self, key: str) -> None:
+        """Remove a value."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove every value."""
+        self._entries.clear()
+
+
+class TwoTierCache:
+    """
+    Local LRU backed by Redis, shared by every worker.
+
+    Invalidations delete the key from both tiers and are published on a Redis channel so
+    other workers drop their local copy too. Redis errors are logged and the cache falls
+    back to the local tier, a cache outage never fails a request.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_size: int,
+        ttl: float,
+        redis_url: str | None = None,
+        *,
+        enabled: bool = True,
+    ) -> None:
+        """Initialize the cache."""
+        self.name = name
+        self.ttl = ttl
+        self.enabled = enabled
+        self.local = LRUCache(max_size, ttl)
+        self.counters = Counters("redis_hits", "redis_misses", "redis_errors", "invalidations")
+        self.channel = f"cache:{name}:invalidate"
+        self._redis = redis.from_url(redis_url, decode_responses=True) if redis_url else None
+        self._listener: asyncio.Task | None = None
+
+    def _key(self, key: str) -> str:
+        """Get the Redis key of a cache key."""
+        return f"cache:{self.name}:{key}"
+
+    def _redis_error(self, err: Exception) -> None:
+        """Count and log a Redis failure."""
+        self.counters.incr("redis_errors")
+        message = f"Cache {self.name} Redis error: {err}"
+        logger.warning(message)
+
+    async def get(self, key: str) -> object | None:
+        """Get a value from the local tier, then from Redis."""
+        if not self.enabled:
+            return None
+
+        value = self.local.get(key)
+        if value is not None or self._redis is None:
+            return value
+
+        self.listen_in_background()
+        try:
+            raw = await self._redis.get(self._key(key))
+        except (OSError, redis.RedisError) as err:
+            self._redis_error(err)
+            return None
+
+        if raw is None:
+            self.counters.incr("redis_misses")
+            return None
+
+        self.counters.incr("redis_hits")
+        value = json.loads(raw)
+        self.local.set(key, value)
+        return value
+
+    async def set(self, key: str, value: object) -> None:
+        """Store a JSON serializable value in both tiers."""
+        if not self.enabled:
+            return
+
+        self.local.set(key, value)
+        if self._redis is None:
+            return
+
+        self.listen_in_background()
+        try:
+            await self._redis.set(self._key(key), json.dumps(value), ex=int(self.ttl) or None)
+        except (OSError, redis.RedisError) as err:
+            self._redis_error(err)
+
+    async def invalidate(self, key: str) -> None:
+        """Drop a value from both tiers and from the local tier of every other worker."""
+        self.counters.incr("invalidations")
+        self.local.delete(key)
+        if self._redis is None:
+            return
+
+        try:
+            await self._redis.delete(self._key(key))
+            await self._redis.publish(self.channel, key)
+        except (OSError, redis.RedisError) as err:
+            self._redis_error(err)
+
+    def listen_in_background(self) -> None:
+        """Start the invalidation listener if it is not running."""
+        if self._redis is None or (self._listener is not None and not self._listener.done()):
+            return
+        self._listener = asyncio.create_task(self._listen())
+
+    async def _listen(self) -> None:
+        """Drop local entries invalidated by other workers."""
+        try:
+            async with self._redis.pubsub() as pubsub:
+                await pubsub.subscribe(self.channel)
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        self.local.delete(message["data"])
+        except (OSError, redis.RedisError) as err:
+            # Entries may have been missed while disconnected, start over from Redis
+            self.local.clear()
+            self._redis_error(err)
+
+    def snapshot(self) -> dict:
+        """Get the size and counters of both tiers."""
+        return {
+            "enabled": self.enabled,
+            "redis": self._redis is not None,
+            "size": len(self.local),
+            "max_size": self.local.max_size,
+            "ttl_seconds": self.ttl,
+            **self.local.counters.snapshot(),
+            **self.counters.snapshot(),
+        }
+
+
+# Serialized users by id
+user_cache = TwoTierCache(
+    "users",
+    max_size=USER_CACHE_MAX_SIZE,
+    ttl=USER_CACHE_TTL_SECONDS,
+    redis_url=REDIS_URL,
+    enabled=USER_CACHE_ENABLED,
+)
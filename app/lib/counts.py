@@ -0,0 +1,124 @@
+"""Total row counts of paginated lists: exact, estimated by the planner, or cached."""
+
+import asyncio
+import json
+import time
+
+from sqlalchemy import Select, func, select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.lib.cache import LRUCache
+from app.lib.database import replica_reads
+from app.lib.soft_delete import exclude_soft_deleted
+from app.utils.logger import get_logger
+
+logger = get_logger()
+
+# exact: COUNT(*) on every page, estimated: the planner's row estimate (EXPLAIN, from
+# pg_class.reltuples and the column statistics), cached: an exact count reused for a while
+COUNT_STRATEGIES = ("exact", "estimated", "cached")
+
+
+def _count_query(query: Select) -> Select:
+    """Get the ``COUNT(*)`` of a select statement."""
+    return select(func.count()).select_from(query.order_by(None).subquery())
+
+
+def _compiled_sql(query: Select) -> str:
+    """Compile a select statement to PostgreSQL with its parameters inlined."""
+    query = exclude_soft_deleted(query.order_by(None))
+    return str(query.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+async def exact_count(db: AsyncSession, query: Select) -> int:
+    """Count the rows of a select statement."""
+    return await db.scalar(_count_query(query))
+
+
+async def estimated_count(db: AsyncSession, query: Select) -> int:
+    """
+    Get the planner's estimate of the rows of a select statement, no row is read.
+
+    The estimate comes from the table statistics refreshed by ANALYZE/autovacuum, it can be
+    off by a few percent on a busy table or far off on a table never analyzed.
+    """
+    plan = await db.scalar(text(f"EXPLAIN (FORMAT JSON) {_compiled_sql(query)}"))
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class CountCache:
+    """
+    Exact counts reused for ``ttl`` seconds, then refreshed in the background.
+
+    A stale count is still served while a single refresh per query runs on its own session,
+    so only the first request of a query ever waits for the ``COUNT(*)``. Entries older than
+    ``max_age`` (the refreshes failed) are counted again in the request.
+    """
+
+    def __init__(self, ttl: float, max_age: float, max_size: int = 1000) -> None:
+        """Initialize the cache."""
+        self.ttl = ttl
+        self._entries = LRUCache(max_size, max_age)
+        self._refreshing: dict[str, asyncio.Task] = {}
+
+    async def _refresh(
+        self, key: str, query: Select, session_factory: async_sessionmaker[AsyncSession]
+    ) -> None:
+        """Count again on a new session and store the result."""
+        try:
+            async with session_factory() as db:
+                with replica_reads(db):
+                    count = await exact_count(db, query)
+            self._entries.set(key, (time.monotonic(), count))
+        except (OSError, SQLAlchemyError) as err:
+            message = f"Count refresh failed: {err}"
+            logger.warning(message)
+        finally:
+            self._refreshing.pop(key, None)
+
+    async def get(
+        self,
+        db: AsyncSession,
+        query: Select,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
+    ) -> tuple[int, bool]:
+        """Get the count of a select statement and whether it may be stale."""
+        key = _compiled_sql(query)
+        entry = self._entries.get(key)
+        if entry is None:
+            count = await exact_count(db, query)
+            self._entries.set(key, (time.monotonic(), count))
+            return count, False
+
+        counted_at, count = entry
+        if time.monotonic() - counted_at > self.ttl and key not in self._refreshing:
+            if session_factory is None:
+                count = await exact_count(db, query)
+                self._entries.set(key, (time.monotonic(), count))
+                return count, False
+            self._refreshing[key] = asyncio.create_task(self._refresh(key, query, session_factory))
+        return count, True
+
+    def clear(self) -> None:
+        """Forget every count."""
+        self._entries.clear()
+
+
+async def count_rows(
+    db: AsyncSession,
+    query: Select,
+    strategy: str = "exact",
+    *,
+    cache: CountCache | None = None,
+    session_factory: async_sessionmaker[AsyncSession] | None = None,
+) -> tuple[int, bool]:
+    """Count the rows of a select statement with a strategy, and whether it is approximate."""
+    if strategy == "estimated":
+        return await estimated_count(db, query), True
+    if strategy == "cached" and cache is not None:
+        return await cache.get(db, query, session_factory)
+    return await exact_count(db, query), False
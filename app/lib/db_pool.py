@@ -0,0 +1,84 @@
+"""Instrumented SQLAlchemy connection pools."""
+
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection, QueuePool
+
+from app.lib.metrics import Counters, Histogram
+from app.utils.logger import get_logger
+
+logger = get_logger()
+
+
+class PoolMetrics:
+    """Checkout counters and wait time histogram for one pool."""
+
+    def __init__(self) -> None:
+        """Initialize the metrics."""
+        self.counters = Counters("checkouts", "checkout_failures", "checkout_timeouts")
+        self.wait_time = Histogram()
+
+    def snapshot(self) -> dict:
+        """Return the metrics as a dictionary."""
+        return {**self.counters.snapshot(), "wait_time_seconds": self.wait_time.snapshot()}
+
+
+class _InstrumentedPoolMixin:
+    """Time every checkout and count failures/timeouts."""
+
+    metrics: PoolMetrics
+
+    def __init__(self, *args: object, **kwargs: object) -> None:
+        """Initialize the pool with fresh metrics."""
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def connect(self) -> PoolProxiedConnection:
+        """Check out a connection, recording how long it took."""
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.metrics.counters.incr("checkout_timeouts")
+            self.metrics.counters.incr("checkout_failures")
+            message = f"Connection pool exhausted: {self.status()}"
+            logger.warning(message)
+            raise
+        except Exception:
+            self.metrics.counters.incr("checkout_failures")
+            raise
+        self.metrics.wait_time.observe(time.perf_counter() - start)
+        self.metrics.counters.incr("checkouts")
+        return connection
+
+    def recreate(self) -> "_InstrumentedPoolMixin":
+        """Recreate the pool, keeping the collected metrics."""
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    """QueuePool with checkout metrics."""
+
+
+class InstrumentedAsyncAdaptedQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool with checkout metrics."""
+
+
+def pool_status(engine: Engine | AsyncEngine) -> dict:
+    """Get the live state and collected metrics of an engine's pool."""
+    pool = engine.pool
+    status = {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        "timeout": pool.timeout(),
+    }
+    if isinstance(pool, _InstrumentedPoolMixin):
+        status.update(pool.metrics.snapshot())
+    return status
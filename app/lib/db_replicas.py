@@ -0,0 +1,126 @@
+"""Read replica health tracking for the routing session."""
+
+import asyncio
+import itertools
+import time
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import ExceptionContext
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.utils.logger import get_logger
+
+logger = get_logger()
+
+# Replication lag in seconds, 0 when the replica has replayed everything it received
+# (or when the server is not a replica at all)
+REPLICATION_LAG_SQL = text(
+    "select case "
+    "when not pg_is_in_recovery() then 0 "
+    "when pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() then 0 "
+    "else coalesce(extract(epoch from now() - pg_last_xact_replay_timestamp()), 0) "
+    "end"
+)
+
+
+class Replica:
+    """A replica engine and its last known health."""
+
+    def __init__(self, name: str, engine: AsyncEngine) -> None:
+        """Initialize the replica, out of rotation until a check finds it healthy."""
+        self.name = name
+        self.engine = engine
+        self.healthy = False
+        self.checked = False
+        self.lag: float | None = None
+
+
+class ReplicaSet:
+    """Round-robin over healthy replicas, refreshed by periodic lag checks."""
+
+    def __init__(
+        self,
+        replicas: list[Replica],
+        max_lag: float = 5.0,
+        check_interval: float = 5.0,
+    ) -> None:
+        """Initialize the replica set."""
+        self.replicas = replicas
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self._cycle = itertools.cycle(replicas)
+        self._last_check = 0.0
+        self._check_task: asyncio.Task | None = None
+
+        for replica in replicas:
+            self._watch_disconnects(replica)
+
+    def __bool__(self) -> bool:
+        """Return True when at least one replica is configured."""
+        return bool(self.replicas)
+
+    def choose(self) -> AsyncEngine | None:
+        """Get the next healthy replica engine, or None to fall back to the primary."""
+        for _ in range(len(self.replicas)):
+            replica = next(self._cycle)
+            if replica.healthy:
+                return replica.engine
+        return None
+
+    async def check(self) -> None:
+        """Measure the lag of every replica and update its health."""
+        for replica in self.replicas:
+            try:
+                async with replica.engine.connect() as connection:
+                    replica.lag = float(await connection.scalar(REPLICATION_LAG_SQL))
+            except (OSError, SQLAlchemyError) as err:
+                if replica.healthy or not replica.checked:
+                    message = f"Replica {replica.name} is down: {err}"
+                    logger.warning(message)
+                replica.healthy = False
+                replica.checked = True
+                replica.lag = None
+                continue
+
+            healthy = replica.lag <= self.max_lag
+            if (replica.healthy or not replica.checked) and not healthy:
+                message = f"Replica {replica.name} is lagging {replica.lag:.1f}s"
+                logger.warning(message)
+            replica.healthy = healthy
+            replica.checked = True
+
+    def mark_down(self, engine: AsyncEngine, err: Exception) -> None:
+        """Take the replica of ``engine`` out of rotation until the next check finds it up."""
+        for replica in self.replicas:
+            if replica.engine is engine and replica.healthy:
+                replica.healthy = False
+                message = f"Replica {replica.name} is down: {err}"
+                logger.warning(message)
+
+    def check_in_background(self) -> None:
+        """Start a health check if the last one is older than the check interval."""
+        now = time.monotonic()
+        if now - self._last_check < self.check_interval:
+            return
+        if self._check_task is not None and not self._check_task.done():
+            return
+
+        self._last_check = now
+        self._check_task = asyncio.create_task(self.check())
+
+    def status(self) -> list[dict]:
+        """Get the health of every replica."""
+        return [
+            {"name": replica.name, "healthy": replica.healthy, "lag_seconds": replica.lag}
+            for replica in self.replicas
+        ]
+
+    def _watch_disconnects(self, replica: Replica) -> None:
+        """Take a replica out of rotation as soon as one of its connections drops."""
+
+        def handle_error(context: ExceptionContext) -> None:
+            if context.is_disconnect:
+                replica.healthy = False
+
+        event.listen(replica.engine.sync_engine, "handle_error", handle_error)
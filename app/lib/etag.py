@@ -0,0 +1,33 @@
+"""Strong ETags and conditional GET (``If-None-Match``) helpers."""
+
+import hashlib
+
+from fastapi import Request, Response, status
+
+
+def make_etag(*parts: object) -> str:
+    """Build a strong ETag from the values that identify a representation."""
+    fingerprint = "|".join("" if part is None else str(part) for part in parts)
+    return f'"{hashlib.blake2b(fingerprint.encode(), digest_size=16).hexdigest()}"'
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """Check whether ``If-None-Match`` already matches ``etag`` (weak comparison, RFC 9110)."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+
+
+def cache_headers(etag: str, cache_control: str) -> dict:
+    """Get the validator and caching headers of a response."""
+    return {"ETag": etag, "Cache-Control": cache_control}
+
+
+def not_modified_response(etag: str, cache_control: str) -> Response:
+    """Get an empty ``304 Not Modified`` response."""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers(etag, cache_control)
+    )
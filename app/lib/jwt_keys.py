@@ -0,0 +1,145 @@
+"""Asymmetric JWT signing and verification with a local key set rotated by ``kid``."""
+
+import os
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from dotenv import load_dotenv
+from fastapi_pundra.common import jwt_utils
+from jose import JWTError, jwk, jwt
+from jose.backends.base import Key
+
+load_dotenv()
+
+# HS256 keeps the shared SECRET_KEY of fastapi_pundra, RS256/ES256 sign with the key set.
+# EdDSA is not supported by python-jose.
+JWT_ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
+ASYMMETRIC_ALGORITHMS = ("RS256", "RS384", "RS512", "ES256", "ES384", "ES512")
+
+# One PEM per key: <kid>.pem holds a private key (it can sign), <kid>.pub.pem a public one
+# (tokens it signed are still accepted after a rotation). JWT_ACTIVE_KID signs new tokens.
+JWT_KEYS_DIR = os.getenv("JWT_KEYS_DIR", "keys")
+JWT_ACTIVE_KID = os.getenv("JWT_ACTIVE_KID", "")
+
+
+class KeySet:
+    """
+    Signing and verification keys parsed once from ``keys_dir``.
+
+    The parsed key objects are reused for every token, ``jwks`` publishes the public half of
+    every key so other services can verify tokens offline.
+    """
+
+    def __init__(self, keys_dir: str | Path, algorithm: str, active_kid: str = "") -> None:
+        """Initialize the key set, keys are loaded on first use."""
+        self.keys_dir = Path(keys_dir)
+        self.algorithm = algorithm
+        self.active_kid = active_kid
+        self._private_keys: dict[str, Key] | None = None
+        self._public_keys: dict[str, Key] = {}
+
+    def load(self) -> "KeySet":
+        """Read and parse every key of the directory."""
+        private_keys, public_keys = {}, {}
+        for pem_file in sorted(self.keys_dir.glob("*.pem")):
+            kid, is_public = pem_file.name.removesuffix(".pem"), False
+            if kid.endswith(".pub"):
+                kid, is_public = kid.removesuffix(".pub"), True
+
+            key = jwk.construct(pem_file.read_text(encoding="utf-8"), self.algorithm)
+            if is_public:
+                public_keys.setdefault(kid, key)
+            else:
+                private_keys[kid] = key
+                public_keys[kid] = key.public_key()
+
+        if self.active_kid and self.active_kid not in private_keys:
+            msg = f"No private key for JWT_ACTIVE_KID {self.active_kid} in {self.keys_dir}"
+            raise ValueError(msg)
+
+        self._private_keys = private_keys
+        self._public_keys = public_keys
+        return self
+
+    def _loaded(self) -> None:
+        """Load the keys if it was not done yet."""
+        if self._private_keys is None:
+            self.load()
+
+    def signing_key(self) -> tuple[str, Key]:
+        """Get the kid and the private key that sign new tokens."""
+        self._loaded()
+        kid = self.active_kid or next(iter(sorted(self._private_keys)), "")
+        if not kid:
+            msg = f"No private key to sign {self.algorithm} tokens in {self.keys_dir}"
+            raise ValueError(msg)
+        return kid, self._private_keys[kid]
+
+    def verification_key(self, kid: str | None) -> Key:
+        """Get the public key of a ``kid``."""
+        self._loaded()
+        key = self._public_keys.get(kid or "")
+        if key is None:
+            msg = f"Unknown key id: {kid}"
+            raise JWTError(msg)
+        return key
+
+    def encode(self, claims: dict) -> str:
+        """Sign claims with the active key, its ``kid`` in the header."""
+        kid, key = self.signing_key()
+        return jwt.encode(claims, key, algorithm=self.algorithm, headers={"kid": kid})
+
+    def decode(self, token: str) -> dict:
+        """Verify a token with the key of its ``kid`` and get its claims."""
+        if not token:
+            msg = "Token is missing"
+            raise JWTError(msg)
+        kid = jwt.get_unverified_header(token).get("kid")
+        return jwt.decode(token, self.verification_key(kid), algorithms=[self.algorithm])
+
+    def jwks(self) -> dict:
+        """Get the public keys as a JSON Web Key Set."""
+        self._loaded()
+        keys = []
+        for kid, key in self._public_keys.items():
+            keys.append({**key.to_dict(), "kid": kid, "use": "sig", "alg": self.algorithm})
+        return {"keys": keys}
+
+
+# Global key set of the asymmetric algorithms, read from JWT_KEYS_DIR on first use
+key_set = KeySet(JWT_KEYS_DIR, JWT_ALGORITHM, JWT_ACTIVE_KID)
+
+
+def is_asymmetric() -> bool:
+    """Check whether tokens are signed with the key set instead of the shared secret."""
+    return key_set.algorithm in ASYMMETRIC_ALGORITHMS
+
+
+def create_access_token(data: dict) -> str:
+    """Create an access token, expiring like the ones of ``fastapi_pundra``."""
+    if not is_asymmetric():
+        return jwt_utils.create_access_token(data)
+    expire = datetime.now(UTC) + timedelta(minutes=jwt_utils.ACCESS_TOKEN_EXPIRE_MINUTES)
+    return key_set.encode({**data, "exp": expire})
+
+
+def create_refresh_token(data: dict) -> str:
+    """Create a refresh token, expiring like the ones of ``fastapi_pundra``."""
+    if not is_asymmetric():
+        return jwt_utils.create_refresh_token(data)
+    expire = datetime.now(UTC) + timedelta(days=jwt_utils.REFRESH_TOKEN_EXPIRE_DAYS)
+    return key_set.encode({**data, "exp": expire})
+
+
+def decode_token(token: str) -> dict:
+    """Verify a token with the configured algorithm, raises ``JWTError`` when invalid."""
+    if not is_asymmetric():
+        return jwt_utils.decode_token(token)
+    return key_set.decode(token)
+
+
+def jwks() -> dict:
+    """Get the published JSON Web Key Set, empty with the shared secret."""
+    if not is_asymmetric():
+        return {"keys": []}
+    return key_set.jwks()
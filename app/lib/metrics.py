@@ -0,0 +1,66 @@
+"""In-process metric primitives exposed through the /metrics routes."""
+
+import bisect
+import threading
+
+# Default latency buckets in seconds
+DEFAULT_LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """Fixed-bucket histogram safe to update from several threads."""
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS) -> None:
+        """Initialize the histogram."""
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """Record a single observation."""
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+            self._count += 1
+
+    def snapshot(self) -> dict:
+        """Return cumulative bucket counts, the observation count and sum."""
+        with self._lock:
+            counts = list(self._counts)
+            total_sum = self._sum
+            total_count = self._count
+
+        cumulative = 0
+        buckets = {}
+        for bound, count in zip(self.buckets, counts, strict=False):
+            cumulative += count
+            buckets[str(bound)] = cumulative
+        buckets["+Inf"] = total_count
+
+        return {"buckets": buckets, "count": total_count, "sum": round(total_sum, 6)}
+
+
+class Counters:
+    """Named integer counters safe to update from several threads."""
+
+    def __init__(self, *names: str) -> None:
+        """Initialize the counters at zero."""
+        self._values = dict.fromkeys(names, 0)
+        self._lock = threading.Lock()
+
+    def incr(self, name: str, amount: int = 1) -> None:
+        """Increment a counter."""
+        with self._lock:
+            self._values[name] = self._values.get(name, 0) + amount
+
+    def get(self, name: str) -> int:
+        """Get the current value of a counter."""
+        return self._values.get(name, 0)
+
+    def snapshot(self) -> dict:
+        """Return a copy of all counters."""
+        with self._lock:
+            return dict(self._values)
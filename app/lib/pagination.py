@@ -0,0 +1,366 @@
+"""Offset and keyset (cursor) pagination for SQLAlchemy select statements."""
+
+import base64
+import binascii
+import json
+import os
+import uuid
+from collections.abc import Callable, Iterable
+from datetime import datetime
+from urllib.parse import urlencode, urlparse
+
+from dotenv import load_dotenv
+from fastapi import Request
+from fastapi_pundra.rest.exceptions import BadRequestException
+from pydantic import BaseModel
+from sqlalchemy import Column, ColumnElement, Select, and_, false, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import DeclarativeBase
+
+from app.lib.counts import COUNT_STRATEGIES, CountCache, count_rows
+from app.lib.serialization import load_serializer_columns, trusted_model
+
+load_dotenv()
+
+TRUE_VALUES = ("1", "true", "yes")
+
+# Largest page a client can ask for with ?per_page=
+PAGINATION_MAX_PER_PAGE = int(os.getenv("PAGINATION_MAX_PER_PAGE", "100"))
+
+# Columns a cursor can sort by besides the serializer fields. Cursors carry the sort key
+# values of the last row, so a column outside these (``password``) would leak through them.
+CURSOR_SORTABLE_COLUMNS = ("created_at", "updated_at")
+
+
+def is_cursor_pagination(request: Request) -> bool:
+    """Check whether the request asks for cursor pagination instead of page/offset."""
+    return (
+        request.query_params.get("pagination") == "cursor"
+        or request.query_params.get("cursor") is not None
+    )
+
+
+def parse_per_page(
+    request: Request, the_per_page: int, max_per_page: int = PAGINATION_MAX_PER_PAGE
+) -> int:
+    """Get the ``per_page`` query parameter, rejected unless between 1 and ``max_per_page``."""
+    per_page = request.query_params.get("per_page", the_per_page)
+    try:
+        per_page = int(per_page)
+    except ValueError as err:
+        raise BadRequestException(message="per_page must be an integer") from err
+
+    if not 1 <= per_page <= max_per_page:
+        msg = f"per_page must be between 1 and {max_per_page}"
+        raise BadRequestException(message=msg)
+    return per_page
+
+
+def page_url_builder(request: Request, **fixed: str | int) -> Callable[..., str]:
+    """
+    Get a function building the URL of another page of ``request``.
+
+    The URL keeps the request query parameters, updated with ``fixed`` and the keyword
+    arguments of each call; a ``None`` value drops the parameter.
+    """
+    parsed_url = urlparse(str(request.url))
+    path_without_query = f"{parsed_url.scheme}://{parsed_url.netloc}{parsed_url.path}"
+
+    def build_url(**params: str | int | None) -> str:
+        query = {**request.query_params, **fixed, **params}
+        query = {name: value for name, value in query.items() if value is not None}
+        return f"{path_without_query}?{urlencode(query)}"
+
+    return build_url
+
+
+def parse_sort(
+    model: type[DeclarativeBase],
+    sort_params: str,
+    tiebreaker: str = "id",
+    allowed: Iterable[str] | None = None,
+) -> list[tuple[Column, bool]]:
+    """
+    Parse a ``sort`` query parameter into ``(column, descending)`` pairs.
+
+    Accepts the same format as ``the_sorting`` (``name,-created_at``), ignores unknown
+    columns and always ends with the unique tiebreaker column so the order is total.
+    With ``allowed``, sorting by a column outside it is rejected.
+    """
+    columns = model.__table__.columns
+    allowed = None if allowed is None else {*allowed, tiebreaker}
+    sort_keys = []
+    for field in sort_params.split(","):
+        field_name = field.removeprefix("-")
+        if field_name not in columns:
+            continue
+        if allowed is not None and field_name not in allowed:
+            msg = f"Cannot sort by {field_name}, allowed: {', '.join(sorted(allowed))}"
+            raise BadRequestException(message=msg)
+        if field_name not in [c.key for c, _ in sort_keys]:
+            sort_keys.append((columns[field_name], field.startswith("-")))
+
+    if tiebreaker not in [column.key for column, _ in sort_keys]:
+        sort_keys.append((columns[tiebreaker], False))
+    return sort_keys
+
+
+def encode_cursor(sort_params: str, values: list) -> str:
+    """Encode the sort key values of the last row into an opaque cursor."""
+
+    def default(value: object) -> str:
+        if isinstance(value, datetime):
+            return value.isoformat()
+        return str(value)
+
+    payload = json.dumps({"s": sort_params, "v": values}, default=default)
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def load_cursor(cursor: str, sort_params: str, size: int) -> list:
+    """Load the raw JSON values of a cursor produced by ``encode_cursor`` for the same sort."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded))
+        values = payload["v"]
+        sort_matches = payload["s"] == sort_params and len(values) == size
+    except (ValueError, KeyError, TypeError, binascii.Error) as err:
+        raise BadRequestException(message="Invalid cursor") from err
+
+    if not sort_matches:
+        raise BadRequestException(message="Cursor does not match the requested sort")
+    return values
+
+
+def decode_cursor(cursor: str, sort_params: str, sort_keys: list[tuple[Column, bool]]) -> list:
+    """Decode a cursor produced by ``encode_cursor`` into the sort columns' python types."""
+    values = load_cursor(cursor, sort_params, len(sort_keys))
+    try:
+        return [
+            _from_json(column, value) for (column, _), value in zip(sort_keys, values, strict=True)
+        ]
+    except (ValueError, TypeError) as err:
+        raise BadRequestException(message="Invalid cursor") from err
+
+
+def _from_json(column: Column, value: object) -> object:
+    """Convert a JSON cursor value back to the column's python type."""
+    if value is None:
+        return None
+    python_type = column.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is uuid.UUID:
+        return uuid.UUID(value)
+    return python_type(value)
+
+
+def _after(column: Column, value: object, *, descending: bool) -> ColumnElement:
+    """Rows strictly after ``value`` (NULLs sort last ascending and first descending)."""
+    if descending:
+        return column.is_not(None) if value is None else column < value
+    if value is None:
+        return false()
+    return or_(column > value, column.is_(None)) if column.nullable else column > value
+
+
+def _equal(column: Column, value: object) -> ColumnElement:
+    """Rows equal to ``value`` for one column."""
+    return column.is_(None) if value is None else column == value
+
+
+def keyset_predicate(sort_keys: list[tuple[Column, bool]], values: list) -> ColumnElement:
+    """Build the ``(a, b, id) > (:a, :b, :id)`` predicate honoring each column's direction."""
+    conditions = []
+    for index, (column, descending) in enumerate(sort_keys):
+        equals = [_equal(c, v) for (c, _), v in zip(sort_keys[:index], values, strict=False)]
+        conditions.append(and_(*equals, _after(column, values[index], descending=descending)))
+    return or_(*conditions) if conditions else false()
+
+
+def keyset_ranges(sort_keys: list[tuple[Column, bool]], values: list) -> list[ColumnElement]:
+    """
+    Split the rows after ``values`` into ranges an index can seek to, in page order.
+
+    ``keyset_predicate`` alone is an OR that Postgres can only apply as a filter, reading
+    every row before the cursor. Here the leading column is bounded (``a >= :a``, or
+    ``a <= :a`` descending) and its NULL group, which sorts after the non-NULL values
+    ascending and before them descending, is a range of its own.
+    """
+    (column, descending), value = sort_keys[0], values[0]
+    after_in_group = keyset_predicate(sort_keys[1:], values[1:])
+
+    if value is None:
+        # The cursor is in the NULL group
+        ranges = [and_(column.is_(None), after_in_group)]
+        if descending:
+            ranges.append(column.is_not(None))
+        return ranges
+
+    bound = column <= value if descending else column >= value
+    after = column < value if descending else column > value
+    ranges = [and_(bound, or_(after, and_(column == value, after_in_group)))]
+    if not descending and column.nullable:
+        ranges.append(column.is_(None))
+    return ranges
+
+
+def keyset_order_by(sort_keys: list[tuple[Column, bool]]) -> list[ColumnElement]:
+    """Build the ORDER BY matching ``keyset_predicate``."""
+    return [
+        column.desc().nulls_first() if descending else column.asc().nulls_last()
+        for column, descending in sort_keys
+    ]
+
+
+async def cursor_paginate(
+    request: Request,
+    db: AsyncSession,
+    query: Select,
+    *,
+    model: type[DeclarativeBase],
+    serializer: type[BaseModel],
+    default_sort: str = "",
+    the_per_page: int = 10,
+    wrap: str = "data",
+    additional_data: dict | Callable[[list], dict] | None = None,
+    project: bool = False,
+) -> dict:
+    """
+    Paginate a select statement with an opaque keyset cursor.
+
+    Query parameters:
+        sort: same format as ``the_sorting``
+        cursor: the ``next_cursor`` of the previous page (omit for the first page)
+        per_page: page size
+        with_total: also run a ``COUNT(*)`` of the whole result set
+
+    With ``project`` only the serializer columns and the sort keys are loaded.
+    """
+    sort_params = request.query_params.get("sort") or default_sort
+    per_page = parse_per_page(request, the_per_page)
+    cursor = request.query_params.get("cursor")
+    with_total = request.query_params.get("with_total", "").lower() in TRUE_VALUES
+
+    # Only columns the client may read end up in the cursor
+    sort_keys = parse_sort(
+        model, sort_params, allowed=[*serializer.model_fields, *CURSOR_SORTABLE_COLUMNS]
+    )
+
+    page_query = query.order_by(None).order_by(*keyset_order_by(sort_keys))
+    if project:
+        sort_columns = [getattr(model, column.key) for column, _ in sort_keys]
+        page_query = page_query.options(load_serializer_columns(model, serializer, *sort_columns))
+    ranges = [None]
+    if cursor:
+        ranges = keyset_ranges(sort_keys, decode_cursor(cursor, sort_params, sort_keys))
+
+    # Read the ranges in order until the page is full, fetching one extra row to know
+    # whether there is a next page
+    rows = []
+    for key_range in ranges:
+        range_query = page_query if key_range is None else page_query.where(key_range)
+        rows.extend((await db.scalars(range_query.limit(per_page + 1 - len(rows)))).all())
+        if len(rows) > per_page:
+            break
+    has_more = len(rows) > per_page
+    rows = rows[:per_page]
+
+    next_cursor = None
+    if has_more:
+        last_row = rows[-1]
+        next_cursor = encode_cursor(
+            sort_params, [getattr(last_row, column.key) for column, _ in sort_keys]
+        )
+
+    data = [trusted_model(serializer, item) for item in rows]
+
+    build_url = page_url_builder(request, pagination="cursor", per_page=per_page)
+
+    output = {
+        "per_page": per_page,
+        "has_more": has_more,
+        "next_cursor": next_cursor,
+        "first_page_url": build_url(cursor=None),
+        "next_page_url": build_url(cursor=next_cursor) if next_cursor else None,
+        "path": str(request.base_url),
+        wrap: data,
+    }
+
+    if with_total:
+        count_query = select(func.count()).select_from(query.order_by(None).subquery())
+        output["total"] = await db.scalar(count_query)
+
+    if additional_data:
+        if callable(additional_data):
+            output["additional_data"] = additional_data(data)
+        else:
+            output["additional_data"] = additional_data
+
+    return output
+
+
+async def offset_paginate(
+    request: Request,
+    db: AsyncSession,
+    query: Select,
+    *,
+    serializer: type[BaseModel],
+    the_page: int = 1,
+    the_per_page: int = 10,
+    wrap: str = "data",
+    additional_data: dict | None = None,
+    count_strategy: str = "exact",
+    count_cache: CountCache | None = None,
+    session_factory: async_sessionmaker[AsyncSession] | None = None,
+) -> dict:
+    """
+    Paginate a select statement with LIMIT/OFFSET, the payload of pundra's ``paginate``.
+
+    ``total`` is computed with ``count_strategy``, or the ``count`` query parameter
+    (``exact``, ``estimated`` or ``cached``, see ``app.lib.counts``), and
+    ``total_is_approximate`` tells whether it may be off. The next page is known from one
+    extra row, so it does not depend on the total.
+    """
+    page = max(int(request.query_params.get("page", the_page)), 1)
+    per_page = parse_per_page(request, the_per_page)
+    strategy = request.query_params.get("count") or count_strategy
+    if strategy not in COUNT_STRATEGIES:
+        msg = f"Unknown count strategy: {strategy}, expected one of {', '.join(COUNT_STRATEGIES)}"
+        raise BadRequestException(message=msg)
+
+    offset = (page - 1) * per_page
+    rows = (await db.scalars(query.offset(offset).limit(per_page + 1))).all()
+    has_more = len(rows) > per_page
+    data = [trusted_model(serializer, item) for item in rows[:per_page]]
+
+    total, approximate = await count_rows(
+        db, query, strategy, cache=count_cache, session_factory=session_factory
+    )
+    if approximate:
+        # Never report fewer rows than the pages already seen
+        total = max(total, offset + len(data) + has_more)
+    last_page = (total + per_page - 1) // per_page
+
+    build_url = page_url_builder(request, per_page=per_page)
+
+    output = {
+        "total": total,
+        "total_is_approximate": approximate,
+        "per_page": per_page,
+        "current_page": page,
+        "last_page": last_page,
+        "first_page_url": build_url(page=1),
+        "last_page_url": build_url(page=last_page),
+        "next_page_url": build_url(page=page + 1) if has_more else None,
+        "prev_page_url": build_url(page=page - 1) if page > 1 else None,
+        "path": str(request.base_url),
+        "from": offset + 1 if data else None,
+        "to": offset + len(data) if data else None,
+        wrap: data,
+    }
+
+    if additional_data:
+        output["additional_data"] = additional_data
+
+    return output
@@ -0,0 +1,150 @@
+"""Bcrypt hashing and verification on a bounded worker pool, off the event loop."""
+
+import asyncio
+import os
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+
+import bcrypt
+from dotenv import load_dotenv
+
+from app.lib.metrics import Counters, Histogram
+
+load_dotenv()
+
+# Bcrypt cost factor for new hashes, existing hashes are upgraded on login
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+
+# Maximum number of hashes computed at the same time
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+# Hashes of bulk jobs (user imports) run on their own pool, so logins never queue behind them
+PASSWORD_HASH_BATCH_WORKERS = int(
+    os.getenv("PASSWORD_HASH_BATCH_WORKERS", str(max(1, PASSWORD_HASH_WORKERS // 2)))
+)
+
+
+class PasswordHasher:
+    """
+    Run bcrypt on a dedicated thread pool.
+
+    bcrypt releases the GIL while hashing, so a small pool keeps bursts of logins from
+    freezing the event loop while capping how many CPU cores they can take. Bulk hashes get
+    a second, smaller pool so a large import cannot delay interactive requests.
+    """
+
+    def __init__(
+        self,
+        rounds: int = BCRYPT_ROUNDS,
+        max_workers: int = PASSWORD_HASH_WORKERS,
+        batch_workers: int = PASSWORD_HASH_BATCH_WORKERS,
+    ) -> None:
+        """Initialize the hasher and its worker pools."""
+        self.rounds = rounds
+        self.max_workers = max_workers
+        self.batch_workers = batch_workers
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix="password-hasher")
+        self._batch_executor = ThreadPoolExecutor(
+            batch_workers, thread_name_prefix="password-hasher-batch"
+        )
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self.counters = Counters("hashes", "verifications", "rehashes")
+        self.queue_time = Histogram()
+        self.run_time = Histogram()
+
+    async def _run(self, func: Callable[..., object], *args: object, batch: bool = False) -> object:
+        """Run ``func`` on the worker pool (or the batch pool), recording queue and run times."""
+        submitted = time.perf_counter()
+        with self._lock:
+            self._queued += 1
+
+        def job() -> object:
+            started = time.perf_counter()
+            self.queue_time.observe(started - submitted)
+            with self._lock:
+                self._queued -= 1
+                self._running += 1
+            try:
+                return func(*args)
+            finally:
+                self.run_time.observe(time.perf_counter() - started)
+                with self._lock:
+                    self._running -= 1
+
+        executor = self._batch_executor if batch else self._executor
+        return await asyncio.get_running_loop().run_in_executor(executor, job)
+
+    def _hash(self, password: str) -> str:
+        """Hash a password (blocking)."""
+        if not isinstance(password, str):
+            msg = "Password must be a string"
+            raise TypeError(msg)
+        if not password:
+            msg = "Password cannot be empty"
+            raise ValueError(msg)
+        return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(self.rounds)).decode("utf-8")
+
+    @staticmethod
+    def _verify(password: str, hashed_password: str | bytes) -> bool:
+        """Check a password against a bcrypt hash (blocking)."""
+        if not isinstance(password, str):
+            msg = "Password must be a string"
+            raise TypeError(msg)
+        if isinstance(hashed_password, str):
+            hashed_password = hashed_password.encode("utf-8")
+        if not hashed_password.startswith((b"$2b$", b"$2a$")):
+            return False
+        try:
+            return bcrypt.checkpw(password.encode("utf-8"), hashed_password)
+        except ValueError:
+            return False
+
+    async def hash(self, password: str) -> str:
+        """Hash a password with the configured cost."""
+        self.counters.incr("hashes")
+        return await self._run(self._hash, password)
+
+    async def hash_many(self, passwords: Iterable[str]) -> list[str]:
+        """Hash passwords of a bulk job on the batch pool, in order."""
+        passwords = list(passwords)
+        self.counters.incr("hashes", len(passwords))
+        return list(
+            await asyncio.gather(*(self._run(self._hash, p, batch=True) for p in passwords))
+        )
+
+    async def verify(self, password: str, hashed_password: str | bytes | None) -> bool:
+        """Check a password against a bcrypt hash, False for missing or malformed hashes."""
+        if not hashed_password:
+            return False
+        self.counters.incr("verifications")
+        return await self._run(self._verify, password, hashed_password)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """Check whether a hash was made with a different cost than the configured one."""
+        try:
+            return int(hashed_password.split("$")[2]) != self.rounds
+        except (IndexError, ValueError):
+            return True
+
+    def snapshot(self) -> dict:
+        """Get the pool state, counters and timings."""
+        with self._lock:
+            queued, running = self._queued, self._running
+        return {
+            "rounds": self.rounds,
+            "max_workers": self.max_workers,
+            "batch_workers": self.batch_workers,
+            "queued": queued,
+            "running": running,
+            **self.counters.snapshot(),
+            "queue_time_seconds": self.queue_time.snapshot(),
+            "run_time_seconds": self.run_time.snapshot(),
+        }
+
+
+# Global hasher instance
+password_hasher = PasswordHasher()
@@ -0,0 +1,103 @@
+"""Paths served without authorization, compiled once into a set and a segment trie."""
+
+from collections.abc import Callable, Iterable
+
+from starlette.routing import BaseRoute
+
+try:
+    # Newer FastAPI versions include routers lazily, this resolves their routes and prefixes
+    from fastapi.routing import iter_route_contexts
+except ImportError:  # pragma: no cover - routers are copied into app.routes
+
+    def iter_route_contexts(routes: Iterable[BaseRoute]) -> Iterable[BaseRoute]:
+        """Get the routes as they are."""
+        return routes
+
+
+# Trie keys that cannot be path segments
+_PREFIX = "/prefix"
+_END = "/end"
+_PARAM = "{}"
+
+
+def public(endpoint: Callable) -> Callable:
+    """Mark a route endpoint as public, place it under the router decorator."""
+    endpoint.__public__ = True
+    return endpoint
+
+
+def _normalize(path: str) -> str:
+    """Drop the trailing slash, ``/health/`` and ``/health`` are the same path."""
+    return path.rstrip("/")
+
+
+def _segments(path: str) -> list[str]:
+    """Split a path into its non empty segments."""
+    return [segment for segment in path.split("/") if segment]
+
+
+class PathExclusions:
+    """
+    Exact paths, path prefixes and route templates that skip authorization.
+
+    Exact paths are a set lookup. Prefixes (``/static`` covers ``/static/app.css``) and route
+    templates (``/api/v1/items/{item_id}``) share a trie of path segments, so a check walks
+    the request path once whatever the number of exclusions.
+    """
+
+    def __init__(
+        self,
+        exact: Iterable[str] = (),
+        prefixes: Iterable[str] = (),
+        templates: Iterable[str] = (),
+    ) -> None:
+        """Compile the exclusions."""
+        self._exact = frozenset(_normalize(path) for path in exact)
+        self._trie: dict = {}
+        for prefix in prefixes:
+            self._add(_segments(prefix), _PREFIX)
+        for template in templates:
+            self._add(_segments(template), _END)
+
+    def _add(self, segments: list[str], marker: str) -> None:
+        """Add a prefix or a route template to the trie."""
+        node = self._trie
+        for segment in segments:
+            if segment.endswith(":path}"):
+                # A {name:path} parameter matches the rest of the path
+                marker = _PREFIX
+                break
+            is_param = segment.startswith("{") and segment.endswith("}")
+            node = node.setdefault(_PARAM if is_param else segment, {})
+        node[marker] = True
+
+    def _match(self, node: dict, segments: list[str], index: int) -> bool:
+        """Walk the trie, trying the literal segment before a route parameter."""
+        if node.get(_PREFIX):
+            return True
+        if index == len(segments):
+            return node.get(_END, False)
+
+        child = node.get(segments[index])
+        if child is not None and self._match(child, segments, index + 1):
+            return True
+        child = node.get(_PARAM)
+        return child is not None and self._match(child, segments, index + 1)
+
+    def is_excluded(self, path: str) -> bool:
+        """Check whether a request path skips authorization."""
+        if _normalize(path) in self._exact:
+            return True
+        return bool(self._trie) and self._match(self._trie, _segments(path), 0)
+
+
+def compile_exclusions(
+    routes: Iterable[BaseRoute], exact: Iterable[str] = (), prefixes: Iterable[str] = ()
+) -> PathExclusions:
+    """Compile the configured exclusions with the routes marked ``@public``."""
+    templates = [
+        route.path
+        for route in iter_route_contexts(list(routes))
+        if getattr(getattr(route, "endpoint", None), "__public__", False) and route.path
+    ]
+    return PathExclusions(exact, prefixes, templates)
@@ -0,0 +1,149 @@
+"""Raw SQL pagination pushed down into the database."""
+
+from collections import OrderedDict
+from datetime import datetime
+from uuid import UUID
+
+from fastapi import Request
+from pydantic import BaseModel
+from sqlalchemy import Row, TextClause, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.lib.pagination import (
+    TRUE_VALUES,
+    encode_cursor,
+    is_cursor_pagination,
+    load_cursor,
+    page_url_builder,
+    parse_per_page,
+)
+from app.lib.serialization import trusted_dump
+
+
+def raw_sql_row_to_dict(row: Row) -> dict:
+    """Convert a row to a dictionary, with UUID and datetime values as strings."""
+    row_dict = dict(row._asdict())
+    for key, value in row_dict.items():
+        if isinstance(value, UUID):
+            row_dict[key] = str(value)
+        elif isinstance(value, datetime):
+            row_dict[key] = value.isoformat()
+    return row_dict
+
+
+def _inner_sql(sql: TextClause | str) -> str:
+    """Get the SQL of a query file without its trailing semicolon."""
+    sql_content = sql.text if isinstance(sql, TextClause) else sql
+    return sql_content.strip().rstrip(";")
+
+
+async def _stream_rows(
+    db: AsyncSession, statement: TextClause, params: dict, serializer: type[BaseModel] | None
+) -> list[dict]:
+    """Read the rows through a server-side cursor, serializing them one at a time."""
+    rows = []
+    result = await db.stream(statement, params)
+    async for row in result:
+        row_dict = raw_sql_row_to_dict(row)
+        rows.append(trusted_dump(serializer, row_dict) if serializer else row_dict)
+    return rows
+
+
+async def raw_sql_count(db: AsyncSession, sql: TextClause | str, params: dict | None = None) -> int:
+    """Count the rows returned by a raw SQL query."""
+    count_sql = text(f"select count(*) from ({_inner_sql(sql)}) as raw_sql_query")  # noqa: S608
+    return await db.scalar(count_sql, params or {})
+
+
+async def raw_sql_paginate(
+    request: Request,
+    db: AsyncSession,
+    sql: TextClause | str,
+    *,
+    params: dict | None = None,
+    serializer: type[BaseModel] | None = None,
+    key_column: str = "id",
+    the_page: int = 1,
+    the_per_page: int = 10,
+    wrap: str = "data",
+    additional_data: dict | None = None,
+) -> dict:
+    """
+    Paginate a raw SQL query with LIMIT/OFFSET, or a keyset cursor on ``key_column``.
+
+    The query is wrapped as a subquery so only one page is ever read from the database,
+    ordered by ``key_column`` so pages are stable. Offset mode returns the same payload as
+    ``raw_sql_rest_paginate``; cursor mode (``?pagination=cursor`` / ``?cursor=``) returns
+    ``next_cursor`` instead of page numbers and only counts with ``?with_total=true``.
+    """
+    per_page = parse_per_page(request, the_per_page)
+    params = params or {}
+    inner_sql = _inner_sql(sql)
+
+    build_url = page_url_builder(request, per_page=per_page)
+
+    if is_cursor_pagination(request):
+        cursor = request.query_params.get("cursor")
+        page_params = {**params, "_limit": per_page + 1}
+        where = ""
+        if cursor:
+            page_params["_after"] = load_cursor(cursor, key_column, 1)[0]
+            where = f"where raw_sql_query.{key_column} > :_after"
+
+        page_sql = text(
+            f"select * from ({inner_sql}) as raw_sql_query {where} "  # noqa: S608
+            f"order by raw_sql_query.{key_column} limit :_limit"
+        )
+        rows = await _stream_rows(db, page_sql, page_params, serializer)
+        has_more = len(rows) > per_page
+        rows = rows[:per_page]
+        next_cursor = encode_cursor(key_column, [rows[-1][key_column]]) if has_more else None
+
+        output = OrderedDict(
+            [
+                (wrap, rows),
+                ("per_page", per_page),
+                ("has_more", has_more),
+                ("next_cursor", next_cursor),
+                ("first_page_url", build_url(pagination="cursor", cursor=None)),
+                ("next_page_url", build_url(cursor=next_cursor) if next_cursor else None),
+                ("path", str(request.base_url)),
+            ]
+        )
+        if request.query_params.get("with_total", "").lower() in TRUE_VALUES:
+            output["total"] = await raw_sql_count(db, inner_sql, params)
+    else:
+        page = max(int(request.query_params.get("page", the_page)), 1)
+        start_index = (page - 1) * per_page
+
+        page_sql = text(
+            f"select * from ({inner_sql}) as raw_sql_query "  # noqa: S608
+            f"order by raw_sql_query.{key_column} limit :_limit offset :_offset"
+        )
+        rows = await _stream_rows(
+            db, page_sql, {**params, "_limit": per_page, "_offset": start_index}, serializer
+        )
+        total = await raw_sql_count(db, inner_sql, params)
+        total_pages = (total + per_page - 1) // per_page
+
+        output = OrderedDict(
+            [
+                (wrap, rows),
+                ("total", total),
+                ("per_page", per_page),
+                ("current_page", page),
+                ("last_page", total_pages),
+                ("first_page_url", build_url(page=1)),
+                ("last_page_url", build_url(page=total_pages)),
+                ("next_page_url", build_url(page=page + 1) if page < total_pages else None),
+                ("prev_page_url", build_url(page=page - 1) if page > 1 else None),
+                ("path", str(request.base_url)),
+                ("from", start_index + 1 if rows else None),
+                ("to", start_index + len(rows) if rows else None),
+            ]
+        )
+
+    if additional_data:
+        output["additional_data"] = additional_data
+
+    return output
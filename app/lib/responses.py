@@ -0,0 +1,32 @@
+"""Application-wide JSON response rendered with orjson."""
+
+from decimal import Decimal
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+def _default(value: object) -> object:
+    """Serialize the types orjson does not know natively."""
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    msg = f"Type is not JSON serializable: {type(value).__name__}"
+    raise TypeError(msg)
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response rendered by orjson in one pass.
+
+    UUID, datetime, date and dataclasses are serialized natively, pydantic models
+    through ``model_dump``, so handlers can return their data without ``jsonable_encoder``.
+    """
+
+    def render(self, content: object) -> bytes:
+        """Render the content to JSON bytes."""
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
@@ -0,0 +1,132 @@
+"""Substring search over text columns, served by ``pg_trgm`` GIN indexes."""
+
+from fastapi import Request
+from fastapi_pundra.rest.exceptions import BadRequestException
+from pydantic import BaseModel
+from sqlalchemy import Column, ColumnElement, Select, case, func, or_, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.lib.pagination import PAGINATION_MAX_PER_PAGE, page_url_builder, parse_per_page
+from app.lib.serialization import trusted_model
+
+# Trigram indexes need at least 3 characters, shorter patterns scan the whole table
+SEARCH_MIN_LENGTH = 3
+
+
+def like_escape(q: str) -> str:
+    r"""Escape the LIKE wildcards of user input (``\`` is the escape character)."""
+    return q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def search_filter(columns: list[Column], q: str) -> ColumnElement:
+    """Rows where any of ``columns`` contains ``q``, case insensitive."""
+    pattern = f"%{like_escape(q)}%"
+    return or_(*(column.ilike(pattern, escape="\\") for column in columns))
+
+
+def _exact_match(columns: list[Column], q: str) -> ColumnElement:
+    """Rows where any of ``columns`` equals ``q``, served by the ``lower()`` btree indexes."""
+    return or_(*(func.lower(column) == q.lower() for column in columns))
+
+
+def _prefix_match(columns: list[Column], q: str) -> ColumnElement:
+    """Rows where any of ``columns`` starts with ``q``, served by the same indexes."""
+    prefix = f"{like_escape(q.lower())}%"
+    return or_(*(func.lower(column).like(prefix, escape="\\") for column in columns))
+
+
+def search_relevance(columns: list[Column], q: str) -> ColumnElement:
+    """Rank exact matches first, then prefix matches, then the other substring matches."""
+    return case((_exact_match(columns, q), 0), (_prefix_match(columns, q), 1), else_=2)
+
+
+def search_window(
+    query: Select,
+    *,
+    key: Column,
+    columns: list[Column],
+    q: str,
+    order_by: list[ColumnElement],
+    max_window: int,
+) -> Select:
+    """
+    Rank a bounded window of the matches of ``q``, most relevant first.
+
+    The window takes up to ``max_window`` keys of each relevance group (exact, prefix, then
+    substring matches) with one indexed lookup each, and only those rows are ranked. No
+    match is left out for a less relevant one, so its first ``max_window`` rows are the
+    most relevant ones; within a group larger than the window, the rows kept are the first
+    ones the index returns, not the first ones of ``order_by``.
+    """
+    matches = query.with_only_columns(key).order_by(None)
+    window = union_all(
+        matches.where(_exact_match(columns, q)).limit(max_window),
+        matches.where(_prefix_match(columns, q)).limit(max_window),
+        matches.where(search_filter(columns, q)).limit(max_window),
+    ).subquery()
+    return (
+        query.where(key.in_(select(*window.c)))
+        .order_by(None)
+        .order_by(search_relevance(columns, q), *order_by)
+    )
+
+
+async def search_paginate(
+    request: Request,
+    db: AsyncSession,
+    query: Select,
+    *,
+    key: Column,
+    columns: list[Column],
+    serializer: type[BaseModel],
+    order_by: list[ColumnElement],
+    the_per_page: int = 10,
+    max_window: int = 1000,
+    wrap: str = "data",
+    additional_data: dict | None = None,
+) -> dict:
+    """
+    Search ``query`` for the ``q`` query parameter, most relevant rows first.
+
+    Only a bounded window of matches is ranked (see ``search_window``), the first
+    ``max_window`` can be paged through and there is no total, so a broad query never
+    counts or sorts millions of rows. ``order_by`` breaks relevance ties.
+    """
+    q = request.query_params.get("q", "").strip()
+    if len(q) < SEARCH_MIN_LENGTH:
+        msg = f"Search query must be at least {SEARCH_MIN_LENGTH} characters"
+        raise BadRequestException(message=msg)
+
+    per_page = parse_per_page(request, the_per_page, min(PAGINATION_MAX_PER_PAGE, max_window))
+    page = max(int(request.query_params.get("page", 1)), 1)
+    offset = (page - 1) * per_page
+    if offset + per_page > max_window:
+        msg = f"Search results are limited to the first {max_window} matches, refine the query"
+        raise BadRequestException(message=msg)
+
+    window = search_window(
+        query, key=key, columns=columns, q=q, order_by=order_by, max_window=max_window
+    )
+    # Fetch one extra row to know whether there is a next page
+    page_query = window.offset(offset).limit(per_page + 1)
+    rows = (await db.scalars(page_query)).all()
+    has_more = len(rows) > per_page and offset + per_page < max_window
+    data = [trusted_model(serializer, item) for item in rows[:per_page]]
+
+    build_url = page_url_builder(request, per_page=per_page)
+
+    output = {
+        "q": q,
+        "per_page": per_page,
+        "current_page": page,
+        "has_more": has_more,
+        "next_page_url": build_url(page=page + 1) if has_more else None,
+        "prev_page_url": build_url(page=page - 1) if page > 1 else None,
+        "path": str(request.base_url),
+        wrap: data,
+    }
+
+    if additional_data:
+        output["additional_data"] = additional_data
+
+    return output
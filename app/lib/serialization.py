@@ -0,0 +1,103 @@
+"""Serialize trusted rows (our own database) with pydantic serializers, skipping validation."""
+
+from collections.abc import Iterable, Mapping
+from functools import lru_cache
+
+from fastapi_pundra.rest.exceptions import BadRequestException
+from pydantic import BaseModel, Field, TypeAdapter, create_model
+from sqlalchemy.orm import DeclarativeBase, InstrumentedAttribute, load_only
+from sqlalchemy.orm.interfaces import ORMOption
+
+
+def output_fields(serializer: type[BaseModel]) -> list[str]:
+    """Get the fields a serializer outputs, the ones excluded by ``?fields=`` left out."""
+    return [name for name, field in serializer.model_fields.items() if not field.exclude]
+
+
+@lru_cache
+def sparse_serializer(serializer: type[BaseModel], fields: frozenset[str]) -> type[BaseModel]:
+    """Get a subclass of ``serializer`` that only outputs ``fields``, built once per set."""
+    excluded = {
+        name: (field.annotation, Field(default=None, exclude=True))
+        for name, field in serializer.model_fields.items()
+        if name not in fields
+    }
+    return create_model(f"{serializer.__name__}Fields", __base__=serializer, **excluded)
+
+
+def fields_serializer(fields: str | None, serializer: type[BaseModel]) -> type[BaseModel]:
+    """
+    Get ``serializer`` restricted to a ``fields`` query parameter (``?fields=id,name``).
+
+    Unknown fields are rejected. The result works everywhere ``serializer`` does, so the
+    projection of ``load_serializer_columns`` and the output both shrink with the request.
+    """
+    if fields is None:
+        return serializer
+
+    fields = frozenset(field.strip() for field in fields.split(",") if field.strip())
+    if not fields:
+        raise BadRequestException(message="fields cannot be empty")
+
+    unknown = sorted(fields - serializer.model_fields.keys())
+    if unknown:
+        allowed = ", ".join(serializer.model_fields)
+        msg = f"Unknown fields: {', '.join(unknown)}. Allowed fields: {allowed}"
+        raise BadRequestException(message=msg)
+
+    if fields == serializer.model_fields.keys():
+        return serializer
+    return sparse_serializer(serializer, fields)
+
+
+@lru_cache
+def list_adapter(serializer: type[BaseModel]) -> TypeAdapter:
+    """Get the ``list[serializer]`` adapter, built once per serializer."""
+    return TypeAdapter(list[serializer])
+
+
+def trusted_model(serializer: type[BaseModel], item: object) -> BaseModel:
+    """
+    Build a serializer instance from an ORM object, a ``Row`` or a mapping without validation.
+
+    Only the serializer fields are read, so columns such as ``password`` are never copied.
+    The values must already have the field types, which holds for rows read from the database.
+    """
+    if isinstance(item, Mapping):
+        values = {name: item.get(name) for name in output_fields(serializer)}
+    else:
+        values = {name: getattr(item, name, None) for name in output_fields(serializer)}
+    return serializer.model_construct(**values)
+
+
+def trusted_dump(serializer: type[BaseModel], item: object) -> dict:
+    """Serialize one trusted row, the output of ``get_serialize_data`` without validation."""
+    return trusted_model(serializer, item).model_dump()
+
+
+def trusted_dump_list(
+    serializer: type[BaseModel], items: Iterable[object], *, mode: str = "python"
+) -> list[dict]:
+    """Serialize trusted rows in one pass of the cached ``list[serializer]`` adapter."""
+    models = [trusted_model(serializer, item) for item in items]
+    return list_adapter(serializer).dump_python(models, mode=mode)
+
+
+def serializer_columns(
+    model: type[DeclarativeBase], serializer: type[BaseModel]
+) -> list[InstrumentedAttribute]:
+    """Get the model columns a serializer reads (``UserSerializer`` -> id, name, email, status)."""
+    columns = model.__table__.columns
+    return [getattr(model, name) for name in output_fields(serializer) if name in columns]
+
+
+def load_serializer_columns(
+    model: type[DeclarativeBase], serializer: type[BaseModel], *extra: InstrumentedAttribute
+) -> ORMOption:
+    """
+    Load only the columns of ``serializer`` (and ``extra``) when selecting ``model`` entities.
+
+    Leave it out where the full entity is needed (the password of a login, an update): reading
+    any other column of a projected entity needs another query, an error under asyncio.
+    """
+    return load_only(*serializer_columns(model, serializer), *extra)
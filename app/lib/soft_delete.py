@@ -0,0 +1,46 @@
+"""Soft delete: rows with ``deleted_at`` set are hidden from every ORM read."""
+
+import os
+
+from dotenv import load_dotenv
+from sqlalchemy import Column, DateTime, event
+from sqlalchemy.orm import ORMExecuteState, Session, with_loader_criteria
+from sqlalchemy.sql import Executable
+
+load_dotenv()
+
+# Deletes set deleted_at instead of removing the row, purged later in batches
+USER_SOFT_DELETE = os.getenv("USER_SOFT_DELETE", "true").lower() == "true"
+
+
+class SoftDeleteMixin:
+    """
+    Mark a model whose rows are soft deleted through its ``deleted_at`` column.
+
+    ORM selects, updates and deletes of these models skip soft deleted rows, pass
+    ``execution_options(include_deleted=True)`` to see them.
+    """
+
+    deleted_at = Column(DateTime(timezone=True), nullable=True)
+
+
+def exclude_soft_deleted(statement: Executable) -> Executable:
+    """Add ``deleted_at IS NULL`` for every soft delete model of a statement."""
+    return statement.options(
+        with_loader_criteria(
+            SoftDeleteMixin,
+            lambda cls: cls.deleted_at.is_(None),
+            include_aliases=True,
+        )
+    )
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _exclude_soft_deleted(orm_execute_state: ORMExecuteState) -> None:
+    """Hide soft deleted rows from every statement executed by a session."""
+    if orm_execute_state.is_column_load or orm_execute_state.is_relationship_load:
+        return
+    if orm_execute_state.execution_options.get("include_deleted", False):
+        return
+
+    orm_execute_state.statement = exclude_soft_deleted(orm_execute_state.statement)
@@ -0,0 +1,56 @@
+"""Registry of the raw SQL files, compiled once into bound ``text()`` statements."""
+
+import re
+from pathlib import Path
+
+from sqlalchemy import Result, TextClause, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Default location of the SQL files: app/sql_files
+SQL_FILES_PATH = Path(__file__).resolve().parents[1] / "sql_files"
+
+# ``--sql_var:user_id`` placeholders become ``:user_id`` bind parameters
+SQL_VAR_PATTERN = re.compile(r"--sql_var:(\w+)")
+
+
+class SqlRegistry:
+    """Load every ``.sql`` file once and serve it by dotted name (``users.fetch-single-user``)."""
+
+    def __init__(self, sql_files_path: Path = SQL_FILES_PATH) -> None:
+        """Initialize the registry."""
+        self.sql_files_path = sql_files_path
+        self._statements: dict[str, TextClause] | None = None
+
+    def load(self) -> "SqlRegistry":
+        """Scan the SQL files directory and compile every file."""
+        statements = {}
+        for sql_file in sorted(self.sql_files_path.rglob("*.sql")):
+            name = ".".join(sql_file.relative_to(self.sql_files_path).with_suffix("").parts)
+            sql_content = sql_file.read_text(encoding="utf-8")
+            statements[name] = text(SQL_VAR_PATTERN.sub(r":\1", sql_content))
+        self._statements = statements
+        return self
+
+    def names(self) -> list[str]:
+        """Get the names of all registered statements."""
+        if self._statements is None:
+            self.load()
+        return list(self._statements)
+
+    def get(self, name: str) -> TextClause:
+        """Get a compiled statement by name."""
+        if self._statements is None:
+            self.load()
+        try:
+            return self._statements[name]
+        except KeyError as err:
+            msg = f"Unknown SQL file: {name}"
+            raise ValueError(msg) from err
+
+    async def execute(self, db: AsyncSession, name: str, params: dict | None = None) -> Result:
+        """Execute a statement by name with bind parameters."""
+        return await db.execute(self.get(name), params or {})
+
+
+# Global registry instance, loaded at application startup
+sql_registry = SqlRegistry()
@@ -0,0 +1,119 @@
+"""Cache of verified JWT payloads, so a reused access token is only verified once."""
+
+import hashlib
+import os
+import threading
+import time
+from collections.abc import Callable
+
+from dotenv import load_dotenv
+from jose import JWTError
+
+from app.lib.cache import LRUCache
+from app.lib.metrics import Counters
+
+load_dotenv()
+
+# Verified tokens kept in memory, at most until their exp and JWT_CACHE_TTL_SECONDS
+JWT_CACHE_ENABLED = os.getenv("JWT_CACHE_ENABLED", "true").lower() == "true"
+JWT_CACHE_MAX_SIZE = int(os.getenv("JWT_CACHE_MAX_SIZE", "10000"))
+JWT_CACHE_TTL_SECONDS = float(os.getenv("JWT_CACHE_TTL_SECONDS", "300"))
+
+
+class VerifiedTokenCache:
+    """
+    LRU of decoded payloads keyed by a hash of the token, the token itself is not kept.
+
+    Only tokens that passed the full verification are stored, until the earliest of their
+    ``exp`` and ``ttl``. ``ttl`` also bounds how long a token revoked by another process is
+    still accepted here; ``revoke`` refuses a token right away until it expires.
+    """
+
+    def __init__(self, max_size: int, ttl: float, *, enabled: bool = True) -> None:
+        """Initialize the cache."""
+        self.enabled = enabled
+        self.ttl = ttl
+        self._entries = LRUCache(max_size, ttl)
+        self._revoked: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self.counters = Counters("verifications", "expired", "revoked")
+
+    @staticmethod
+    def _key(token: str) -> str:
+        """Get the cache key of a token."""
+        return hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+
+    def _is_revoked(self, key: str, now: float) -> bool:
+        """Check whether a token was revoked and has not expired since."""
+        expires_at = self._revoked.get(key)
+        if expires_at is None:
+            return False
+        if expires_at <= now:
+            with self._lock:
+                self._revoked.pop(key, None)
+            return False
+        return True
+
+    def verify(self, token: str, decode: Callable[[str], dict]) -> dict:
+        """Get the payload of a token, verified by ``decode`` unless it is cached."""
+        key = self._key(token)
+        now = time.time()
+        if self._is_revoked(key, now):
+            self.counters.incr("revoked")
+            msg = "Token has been revoked"
+            raise JWTError(msg)
+
+        if self.enabled:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, payload = entry
+                if expires_at > now:
+                    return dict(payload)
+                # Expired since it was cached, decode() rejects it with the right error
+                self._entries.delete(key)
+                self.counters.incr("expired")
+
+        self.counters.incr("verifications")
+        payload = decode(token)
+        if self.enabled:
+            expires_at = payload.get("exp")
+            if not isinstance(expires_at, (int, float)):
+                expires_at = now + self.ttl
+            self._entries.set(key, (expires_at, payload))
+        return dict(payload)
+
+    def revoke(self, token: str, expires_at: float | None = None) -> None:
+        """Refuse a token until ``expires_at`` (its ``exp``, or ``ttl`` from now)."""
+        key = self._key(token)
+        now = time.time()
+        with self._lock:
+            self._revoked = {k: exp for k, exp in self._revoked.items() if exp > now}
+            self._revoked[key] = expires_at or now + self.ttl
+        self._entries.delete(key)
+
+    def clear(self) -> None:
+        """Forget every cached and revoked token."""
+        with self._lock:
+            self._revoked.clear()
+        self._entries.clear()
+
+    def snapshot(self) -> dict:
+        """Get the size, hit rate and counters."""
+        counters = self._entries.counters.snapshot()
+        lookups = counters["hits"] + counters["misses"]
+        return {
+            "enabled": self.enabled,
+            "size": len(self._entries),
+            "max_size": self._entries.max_size,
+            "ttl_seconds": self.ttl,
+            "revoked_tokens": len(self._revoked),
+            **counters,
+            "hit_rate": counters["hits"] / lookups if lookups else 0.0,
+            **self.counters.snapshot(),
+        }
+
+
+# Verified access tokens of the authorization middleware
+token_cache = VerifiedTokenCache(
+    JWT_CACHE_MAX_SIZE, JWT_CACHE_TTL_SECONDS, enabled=JWT_CACHE_ENABLED
+)
@@ -6,7 +6,11 @@ from fastapi_pundra.rest.global_exception_handler import setup_exception_handler
 from fastapi_pundra.rest.openapi import discover_schemas, generate_openapi_schema
 from app.middleware.authorization_middleware import AuthorizationMiddleware
 from app.api.router import router as api_router
+from app.config.authorization import EXCLUDE_PATH_PREFIXES, EXCLUDE_PATHS
 from app.config.cors import CORS_CONFIG
+from app.lib.path_exclusions import compile_exclusions
+from app.lib.responses import FastJSONResponse
+from app.lib.sql_registry import sql_registry
 
 
 # Load .env file
@@ -15,17 +19,22 @@ load_dotenv()
 
 def create_application() -> FastAPI:
     """Create the FastAPI application."""
-    application = FastAPI()
+    # Responses are rendered with orjson, handlers return their data directly
+    application = FastAPI(default_response_class=FastJSONResponse)
+
+    # Compile the raw SQL files once, services execute them by name
+    sql_registry.load()
 
     # Setup global exception handler
     setup_exception_handlers(application)
 
-    # Setup authorization middleware
-    application.add_middleware(AuthorizationMiddleware)
-
     # Auto-include all API routes from app.api folder
     application.include_router(api_router)
 
+    # Setup authorization middleware, the excluded paths and @public routes are compiled once
+    exclusions = compile_exclusions(application.routes, EXCLUDE_PATHS, EXCLUDE_PATH_PREFIXES)
+    application.add_middleware(AuthorizationMiddleware, exclusions=exclusions)
+
     # CORS middleware
     application.add_middleware(
         CORSMiddleware,
@@ -1,64 +1,77 @@
-from collections.abc import Callable, Awaitable
 from datetime import datetime, UTC
-from fastapi import FastAPI, Request, Response
 from fastapi.responses import JSONResponse
-from fastapi_pundra.common.jwt_utils import decode_token
 from fastapi_pundra.rest.exceptions import UnauthorizedException
 from jose import JWTError
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
 
-from app.config.authorization import EXCLUDE_PATHS
+from app.config.authorization import EXCLUDE_PATH_PREFIXES, EXCLUDE_PATHS
+from app.lib.jwt_keys import decode_token
+from app.lib.path_exclusions import PathExclusions
+from app.lib.token_cache import token_cache
 
 
-class AuthorizationMiddleware(BaseHTTPMiddleware):
-    """Authorization middleware."""
+class AuthorizationMiddleware:
+    """
+    Authorization middleware.
 
-    def __init__(self, app: FastAPI) -> None:
-        """Initialize the middleware."""
-        super().__init__(app)
+    A pure ASGI middleware: the request is handed to the app untouched, with no extra task
+    or memory stream per request, so streamed responses are not buffered either.
+    """
 
-    def verify_access_token(self, request: Request) -> dict | None:
+    def __init__(self, app: ASGIApp, exclusions: PathExclusions | None = None) -> None:
+        """Initialize the middleware, the configured paths are excluded by default."""
+        self.app = app
+        self.exclusions = exclusions or PathExclusions(EXCLUDE_PATHS, EXCLUDE_PATH_PREFIXES)
+
+    def verify_access_token(self, headers: Headers) -> dict | None:
         """Verify the access token."""
-        auth_header = request.headers.get("Authorization")
+        auth_header = headers.get("Authorization")
         if not auth_header:
             raise UnauthorizedException(message="No authorization header")
 
         try:
             scheme, token = auth_header.split()
-            if scheme.lower() != "bearer":
-                raise UnauthorizedException(message="Invalid authentication scheme")
-
-            return decode_token(token)
+        except ValueError as err:
+            raise UnauthorizedException(message="Invalid authentication scheme") from err
+        if scheme.lower() != "bearer":
+            raise UnauthorizedException(message="Invalid authentication scheme")
 
+        try:
+            # Tokens are reused for many requests, their signature is only verified once
+            return token_cache.verify(token, decode_token)
         except JWTError as err:
             raise UnauthorizedException(message="Invalid token") from err
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable[[Request], Awaitable[Response]],
-    ) -> Response:
-        """Dispatch the middleware."""
-        try:
-            # Skip token verification for certain paths (optional)
-            request_path = request.url.path.rstrip("/")  # Remove trailing slash if present
-            if any(request_path == excluded.rstrip("/") for excluded in EXCLUDE_PATHS):
-                return await call_next(request)
-
-            # Verify the token and get payload
-            payload = self.verify_access_token(request)
-            # Add the payload to request state for use in route handlers
-            request.state.user = payload
-
-            # Set additional state variables
-            request.state.auth_user_id = payload.get("user_id")
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Verify the token of HTTP requests, outside the excluded paths."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-            return await call_next(request)
+        # Skip token verification for the excluded paths and the @public routes
+        if self.exclusions.is_excluded(scope["path"]):
+            await self.app(scope, receive, send)
+            return
 
+        try:
+            # Verify the token and get payload
+            payload = self.verify_access_token(Headers(scope=scope))
         except UnauthorizedException as exc:
             error_response = exc.to_dict()
-            error_response["path"] = request.url.path
+            error_response["path"] = scope["path"]
             error_response["type"] = exc.__class__.__name__
             error_response["timestamp"] = datetime.now(UTC).isoformat()
 
-            return JSONResponse(content=error_response, status_code=exc.status_code)
+            response = JSONResponse(content=error_response, status_code=exc.status_code)
+            await response(scope, receive, send)
+            return
+
+        # Add the payload to request state for use in route handlers
+        state = scope.setdefault("state", {})
+        state["user"] = payload
+
+        # Set additional state variables
+        state["auth_user_id"] = payload.get("user_id")
+
+        await self.app(scope, receive, send)
@@ -0,0 +1,21 @@
+from sqlalchemy import BigInteger, Column, SmallInteger, String
+
+from app.lib.database import Base
+
+
+class UserStatusCount(Base):
+    """
+    SQLAlchemy model for the per-status user counters, maintained on user writes.
+
+    Each status has several shard rows and a write adds to a random one, so concurrent
+    registrations and deletes do not queue on a single row lock. Totals are the sum of the
+    shards. ``version`` counts the user writes committed with the row, the sum of the versions
+    only grows and fingerprints the users list.
+    """
+
+    __tablename__ = "user_status_counts"
+
+    status = Column(String, primary_key=True)
+    shard = Column(SmallInteger, primary_key=True, default=0, server_default="0")
+    total = Column(BigInteger, nullable=False, default=0, server_default="0")
+    version = Column(BigInteger, nullable=False, default=0, server_default="0")
@@ -1,25 +1,55 @@
 import uuid
 
-from sqlalchemy import Column, DateTime, String
+from sqlalchemy import Column, DateTime, Index, String, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 
 from app.lib.database import Base
+from app.lib.soft_delete import SoftDeleteMixin
 
 
-class User(Base):
+class User(SoftDeleteMixin, Base):
     """SQLAlchemy model for the users table."""
 
     __tablename__ = "users"
+    # Partial indexes only cover live rows, soft deleted rows are kept out of them.
+    # The pg_trgm GIN indexes of the search (ix_users_name_trgm, ix_users_email_trgm) are
+    # created by migration only, as the extension is not available everywhere.
+    __table_args__ = (
+        Index(
+            "ix_users_email_active",
+            "email",
+            unique=True,
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index("ix_users_status_active", "status", postgresql_where=text("deleted_at IS NULL")),
+        # Exact and prefix matches of the search, lower(column) = / LIKE 'q%'
+        Index(
+            "ix_users_name_lower",
+            text("lower(name) text_pattern_ops"),
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "ix_users_email_lower",
+            text("lower(email) text_pattern_ops"),
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        # Cursor pages sorted by updated_at
+        Index(
+            "ix_users_updated_at_active",
+            "updated_at",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index("ix_users_deleted_at", "deleted_at", postgresql_where=text("deleted_at IS NOT NULL")),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, index=True, default=uuid.uuid4)
     name = Column(String, index=True, nullable=True)
-    email = Column(String, unique=True, index=True, nullable=True)
+    email = Column(String, nullable=True)
     password = Column(String, nullable=True)
     status = Column(String, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
-    deleted_at = Column(DateTime(timezone=True), nullable=True)
 
     def as_dict(self) -> dict:
         """Convert the model instance to a dictionary."""
@@ -1,4 +1,7 @@
-from pydantic import BaseModel, EmailStr, field_validator
+import os
+from uuid import UUID
+
+from pydantic import BaseModel, EmailStr, Field, field_validator
 from fastapi import UploadFile, File
 
 
@@ -31,6 +34,16 @@ class UserUpdateSchema(BaseModel):
     password: str | None = None
 
 
+# Maximum number of ids of one batch lookup
+USER_BATCH_MAX_IDS = int(os.getenv("USER_BATCH_MAX_IDS", "100"))
+
+
+class UserBatchSchema(BaseModel):
+    """User batch lookup schema."""
+
+    ids: list[UUID] = Field(min_length=1, max_length=USER_BATCH_MAX_IDS)
+
+
 class UserLoginSchema(BaseModel):
     """User login schema."""
 
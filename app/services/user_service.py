@@ -1,61 +1,316 @@
+import os
+import random
+import uuid
+import csv
+import io
+from collections.abc import AsyncIterable, AsyncIterator
+from contextlib import nullcontext
+from datetime import datetime
+
+import orjson
 from fastapi import Request, BackgroundTasks
-from fastapi_pundra.common.jwt_utils import create_access_token, create_refresh_token
-from fastapi_pundra.common.password import compare_hashed_password, generate_password_hash
-from fastapi_pundra.rest.helpers import get_serialize_data
 from fastapi_pundra.rest.exceptions import (
     BaseAPIException,
     ItemNotFoundException,
     UnauthorizedException,
 )
 from fastapi_pundra.rest.helpers import the_query, the_sorting
-from fastapi_pundra.rest.paginate import paginate
-from sqlalchemy.orm import Session
-
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    any_,
+    bindparam,
+    delete,
+    func,
+    literal,
+    literal_column,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, UUID, insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.lib.bulk_import import iter_batches, iter_records, validation_errors
+from app.lib.cache import user_cache
+from app.lib.database import replica_reads
+from app.lib.etag import make_etag
+from app.lib.jwt_keys import create_access_token, create_refresh_token
+from app.lib.counts import CountCache
+from app.lib.pagination import cursor_paginate, is_cursor_pagination, offset_paginate
+from app.lib.password_hasher import password_hasher
+from app.lib.raw_sql import raw_sql_paginate
+from app.lib.search import search_paginate
+from app.lib.serialization import (
+    fields_serializer,
+    load_serializer_columns,
+    output_fields,
+    serializer_columns,
+    trusted_dump,
+    trusted_dump_list,
+)
+from app.lib.soft_delete import USER_SOFT_DELETE
+from app.lib.sql_registry import sql_registry
+from app.models.user_status_counts import UserStatusCount
 from app.models.users import User
 from app.schemas.user_schema import UserCreateSchema
 from app.serializers.user_serializer import UserLoginSerializer, UserSerializer
 
 from fastapi_pundra.common.mailer.mail import send_mail_background
 
-from fastapi_pundra.common.raw_sql.utils import (
-    raw_sql_fetch_all,
-    raw_sql_rest_paginate,
-    load_sql_file,
-    raw_sql_fetch_one,
-)
+from fastapi_pundra.common.raw_sql.utils import raw_sql_fetch_one
 
 from app.utils.logger import get_logger
 
 logger = get_logger()
 
+# Where the active/inactive totals of the user lists come from:
+# "query" (GROUP BY status over users) or "counter_table" (user_status_counts)
+USER_STATUS_COUNTS_SOURCE = os.getenv("USER_STATUS_COUNTS_SOURCE", "query")
+
+# Rows each status counter is spread over, writers pick one at random
+USER_STATUS_COUNTS_SHARDS = int(os.getenv("USER_STATUS_COUNTS_SHARDS", "16"))
+
+# Total of the users list pages: exact | estimated | cached, cached counts are refreshed
+# in the background once older than the TTL
+USER_LIST_COUNT_STRATEGY = os.getenv("USER_LIST_COUNT_STRATEGY", "exact")
+USER_COUNT_CACHE_TTL_SECONDS = float(os.getenv("USER_COUNT_CACHE_TTL_SECONDS", "30"))
+
+# Search (?q=) only pages through the most relevant matches
+USER_SEARCH_MAX_WINDOW = int(os.getenv("USER_SEARCH_MAX_WINDOW", "1000"))
+
+# Bulk import: rows validated, hashed and COPYed per batch, errors reported per response
+USER_IMPORT_BATCH_SIZE = int(os.getenv("USER_IMPORT_BATCH_SIZE", "1000"))
+USER_IMPORT_MAX_ERRORS = 1000
+
+# Bulk export: rows fetched from the server-side cursor and sent per chunk
+USER_EXPORT_CHUNK_SIZE = int(os.getenv("USER_EXPORT_CHUNK_SIZE", "1000"))
+
+# Cached list totals, recounted in the request when the refreshes keep failing
+user_count_cache = CountCache(
+    ttl=USER_COUNT_CACHE_TTL_SECONDS, max_age=USER_COUNT_CACHE_TTL_SECONDS * 10
+)
+
+# Reads load only the UserSerializer columns, login and update load the full entity
+USER_PROJECTION = load_serializer_columns(User, UserSerializer)
+
+# Temporary table the imported rows are COPYed into before the upsert into users
+user_import_staging = Table(
+    "user_import_staging",
+    MetaData(),
+    Column("line", Integer),
+    Column("id", UUID(as_uuid=True)),
+    Column("name", String),
+    Column("email", String),
+    Column("password", String),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
+
 
 class UserService:
     """User service."""
 
+    async def _status_counts(self, db: AsyncSession) -> dict:
+        """Count active and inactive users in SQL."""
+        if USER_STATUS_COUNTS_SOURCE == "counter_table":
+            total = func.sum(UserStatusCount.total).cast(BigInteger)
+            query = select(UserStatusCount.status, total).group_by(UserStatusCount.status)
+        else:
+            query = select(User.status, func.count()).group_by(User.status)
+
+        totals = dict((await db.execute(query)).all())
+        return {
+            "active_users": totals.get("active", 0),
+            "inactive_users": totals.get("inactive", 0),
+        }
+
+    async def _adjust_status_count(self, db: AsyncSession, status: str | None, delta: int) -> None:
+        """
+        Add ``delta`` to a random shard of the counter of ``status``, in the transaction.
+
+        The shard version is bumped too, so every user write (``delta`` 0 for updates) changes
+        the users list ETag when it commits.
+        """
+        if status is None:
+            return
+
+        shard = random.randrange(USER_STATUS_COUNTS_SHARDS)  # noqa: S311
+        upsert = insert(UserStatusCount).values(status=status, shard=shard, total=delta, version=1)
+        upsert = upsert.on_conflict_do_update(
+            index_elements=[UserStatusCount.status, UserStatusCount.shard],
+            set_={"total": UserStatusCount.total + delta, "version": UserStatusCount.version + 1},
+        )
+        await db.execute(upsert)
+
+    async def _copy_upsert_users(
+        self, db: AsyncSession, records: list[tuple], *, update_existing: bool
+    ) -> dict:
+        """COPY rows into the staging table and upsert them into users, one transaction."""
+        connection = await db.connection()
+        await connection.run_sync(user_import_staging.create)
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            user_import_staging.name,
+            records=records,
+            columns=[column.name for column in user_import_staging.columns],
+        )
+
+        staged = user_import_staging.c
+        query = insert(User).from_select(
+            ["id", "name", "email", "password", "status"],
+            select(staged.id, staged.name, staged.email, staged.password, literal("active")),
+        )
+        if update_existing:
+            query = query.on_conflict_do_update(
+                index_elements=[User.email],
+                index_where=User.deleted_at.is_(None),
+                set_={
+                    "name": func.coalesce(query.excluded.name, User.name),
+                    "password": query.excluded.password,
+                    "updated_at": func.now(),
+                },
+            )
+        else:
+            query = query.on_conflict_do_nothing(
+                index_elements=[User.email], index_where=User.deleted_at.is_(None)
+            )
+
+        # xmax is 0 for freshly inserted rows and set for rows updated by the conflict
+        query = query.returning(User.id, User.email, literal_column("xmax = 0").label("inserted"))
+        rows = (await db.execute(query)).all()
+
+        inserted = sum(1 for row in rows if row.inserted)
+        if rows:
+            await self._adjust_status_count(db, "active", inserted)
+        await db.commit()
+
+        for row in rows:
+            if not row.inserted:
+                await self._invalidate_user(str(row.id))
+        return {row.email: row.inserted for row in rows}
+
+    async def s_import_users(
+        self,
+        db: AsyncSession,
+        lines: AsyncIterable[str],
+        import_format: str,
+        *,
+        update_existing: bool = False,
+    ) -> dict:
+        """
+        Bulk import users from CSV (with a header line) or NDJSON lines.
+
+        Rows are validated against ``UserCreateSchema`` in batches, their passwords hashed on
+        the password hasher pool and written with ``COPY`` plus one upsert per batch. Invalid
+        rows and already registered emails (unless ``update_existing``) are reported with
+        their line number, the rest of the batch is still imported.
+        """
+        report = {"total": 0, "imported": 0, "updated": 0, "failed": 0}
+        errors = []
+
+        def fail(line: int, row_errors: dict) -> None:
+            report["failed"] += 1
+            if len(errors) < USER_IMPORT_MAX_ERRORS:
+                errors.append({"line": line, "errors": row_errors})
+
+        records = iter_records(lines, import_format)
+        async for batch in iter_batches(records, USER_IMPORT_BATCH_SIZE):
+            report["total"] += len(batch)
+
+            valid = {}
+            for line, record in batch:
+                data, row_errors = validation_errors(UserCreateSchema, record)
+                if not row_errors and data.email in valid:
+                    row_errors = {"email": ["email is duplicated in the import"]}
+                if row_errors:
+                    fail(line, row_errors)
+                    continue
+                valid[data.email] = (line, data)
+
+            if not valid:
+                continue
+
+            hashes = await password_hasher.hash_many(data.password for _, data in valid.values())
+            rows = [
+                (line, uuid.uuid4(), data.name, data.email, hashed)
+                for (line, data), hashed in zip(valid.values(), hashes, strict=True)
+            ]
+            written = await self._copy_upsert_users(db, rows, update_existing=update_existing)
+
+            for email, (line, _) in valid.items():
+                if email not in written:
+                    fail(line, {"email": ["Email already registered"]})
+                    continue
+                report["imported" if written[email] else "updated"] += 1
+
+        return {
+            "success": True,
+            "message": "Import finished",
+            **report,
+            "errors": errors,
+        }
+
+    async def s_export_users(
+        self, session_factory: async_sessionmaker[AsyncSession], export_format: str
+    ) -> AsyncIterator[str]:
+        """
+        Stream every user as NDJSON or CSV (with a header line) serialized by ``UserSerializer``.
+
+        Rows come from a server-side cursor, ``USER_EXPORT_CHUNK_SIZE`` at a time, and the next
+        chunk is only fetched once the previous one was sent, so memory stays flat whatever the
+        table size. The session is opened here as the response outlives the request handler.
+        """
+        fields = list(UserSerializer.model_fields)
+        query = select(*serializer_columns(User, UserSerializer)).order_by(User.id)
+
+        if export_format == "csv":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(fields)
+            yield buffer.getvalue()
+
+        async with session_factory() as db:
+            with replica_reads(db):
+                result = await db.stream(query.execution_options(yield_per=USER_EXPORT_CHUNK_SIZE))
+                async for rows in result.partitions():
+                    users = trusted_dump_list(UserSerializer, rows, mode="json")
+                    if export_format == "csv":
+                        buffer.seek(0)
+                        buffer.truncate()
+                        writer.writerows(user.values() for user in users)
+                        yield buffer.getvalue()
+                    else:
+                        yield "".join(f"{orjson.dumps(user).decode()}\n" for user in users)
+
     async def s_registration(
         self,
         request: Request,
-        db: Session,
+        db: AsyncSession,
         data: UserCreateSchema,
         background_tasks: BackgroundTasks,
     ) -> dict:
         """Register a new user."""
-        db_user = db.query(User).filter(User.email == data.email).first()
+        db_user = await db.scalar(select(User).where(User.email == data.email))
 
         if db_user:
             raise BaseAPIException(message="Email already registered", status_code=400)
 
         new_user = User()
         new_user.email = data.email
-        new_user.password = generate_password_hash(data.password)
+        new_user.password = await password_hasher.hash(data.password)
         new_user.name = data.name
         new_user.status = "active"
 
         db.add(new_user)
-        db.commit()
-        db.refresh(new_user)
+        await self._adjust_status_count(db, new_user.status, 1)
+        await db.commit()
+        await db.refresh(new_user)
 
-        user_data = get_serialize_data(UserSerializer, new_user.as_dict())
+        user_data = trusted_dump(UserSerializer, new_user)
 
         # Send welcome email in background
         template_name = "welcome_email.html"
@@ -77,38 +332,162 @@ class UserService:
             "user": user_data,
         }
 
-    async def s_get_users(self, request: Request, db: Session) -> dict:
-        """Get users."""
-        query = db.query(User)
-
-        # TODO: add logic here if you want to filter users
-
-        query = the_sorting(request, query, default_sort="email")
+    async def s_get_users_etag(self, request: Request, db: AsyncSession) -> str:
+        """
+        Get the ETag of a users list page.
 
-        def additional_data(data: list) -> dict:
-            total_active_users = len([user for user in data if user.status == "active"])
-            total_inactive_users = len([user for user in data if user.status == "inactive"])
-            return {"active_users": total_active_users, "inactive_users": total_inactive_users}
+        The fingerprint is the sum of the ``user_status_counts`` versions, which every user
+        write bumps in its own transaction, and the query string of the page. It is read
+        before the page, so a page is never served under the ETag of an older one.
+        """
+        with replica_reads(db):
+            version = await db.scalar(select(func.coalesce(func.sum(UserStatusCount.version), 0)))
 
-        return paginate(
-            request,
-            query,
-            serilizer=UserSerializer,
-            wrap="users",
-            additional_data=additional_data,
-        )
+        query_string = sorted(request.query_params.items())
+        return make_etag("users", version, query_string)
 
-    async def s_get_user_by_id(self, request: Request, db: Session, user_id: str) -> User:
-        """Get user by id."""
-        user = db.query(User).filter(User.id == user_id).first()
+    async def s_get_users(
+        self,
+        request: Request,
+        db: AsyncSession,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
+    ) -> dict:
+        """
+        Get users, only the ``?fields=`` columns are selected and returned when given.
+
+        The total of the offset pages is counted with ``USER_LIST_COUNT_STRATEGY`` (or
+        ``?count=``), ``session_factory`` refreshes the cached counts in the background.
+        """
+        serializer = fields_serializer(request.query_params.get("fields"), UserSerializer)
+        projection = load_serializer_columns(User, serializer)
+
+        with replica_reads(db):
+            additional_data = await self._status_counts(db)
+
+            if request.query_params.get("q") is not None:
+                return await search_paginate(
+                    request,
+                    db,
+                    select(User).options(projection),
+                    key=User.id,
+                    columns=[User.name, User.email],
+                    serializer=serializer,
+                    order_by=[User.email, User.id],
+                    max_window=USER_SEARCH_MAX_WINDOW,
+                    wrap="users",
+                    additional_data=additional_data,
+                )
+
+            if is_cursor_pagination(request):
+                return await cursor_paginate(
+                    request,
+                    db,
+                    select(User),
+                    model=User,
+                    serializer=serializer,
+                    default_sort="email",
+                    wrap="users",
+                    additional_data=additional_data,
+                    project=True,
+                )
+
+            query = the_sorting(request, select(User).options(projection), default_sort="email")
+
+            return await offset_paginate(
+                request,
+                db,
+                query,
+                serializer=serializer,
+                wrap="users",
+                additional_data=additional_data,
+                count_strategy=USER_LIST_COUNT_STRATEGY,
+                count_cache=user_count_cache,
+                session_factory=session_factory,
+            )
+
+    async def _invalidate_user(self, user_id: str) -> None:
+        """Drop a user and its ETag from the cache after a write."""
+        await user_cache.invalidate(user_id)
+        await user_cache.invalidate(f"{user_id}:etag")
+
+    async def s_get_user_etag(
+        self, request: Request, db: AsyncSession, user_id: str, fields: str | None = None
+    ) -> str | None:
+        """
+        Get the ETag of a user from its id and ``updated_at``, None when it does not exist.
+
+        Each ``fields`` selection is a different representation and gets its own ETag.
+        """
+        etag = await user_cache.get(f"{user_id}:etag")
+        if etag is None:
+            # Cache fills read the primary, a lagging replica would cache a stale ETag
+            row = (await db.execute(select(User.updated_at).where(User.id == user_id))).first()
+            if row is None:
+                return None
+
+            etag = make_etag("user", user_id, row.updated_at)
+            await user_cache.set(f"{user_id}:etag", etag)
+
+        return etag if fields is None else make_etag(etag, fields)
+
+    async def s_get_user_by_id(
+        self, request: Request, db: AsyncSession, user_id: str, fields: str | None = None
+    ) -> dict:
+        """
+        Get user by id, restricted to the comma separated ``fields`` when given.
+
+        The cache holds full users: a hit is trimmed to ``fields``, a miss with ``fields``
+        selects only those columns and is not cached. Cache fills read the primary, a
+        lagging replica could cache the row an update just invalidated on every worker.
+        """
+        serializer = fields_serializer(fields, UserSerializer)
+        user_data = await user_cache.get(user_id)
+        if user_data is not None:
+            return {name: user_data[name] for name in output_fields(serializer)}
+
+        cache_fill = serializer is UserSerializer
+        query = select(User).options(load_serializer_columns(User, serializer))
+        with nullcontext(db) if cache_fill else replica_reads(db):
+            user = await db.scalar(query.where(User.id == user_id))
 
         if user is None:
             raise ItemNotFoundException(message="User not found")
 
-        user_data = get_serialize_data(UserSerializer, user.as_dict())
+        user_data = trusted_dump(serializer, user)
+        if cache_fill:
+            await user_cache.set(user_id, user_data)
         return user_data
 
-    async def s_login(self, request: Request, db: Session) -> dict:
+    async def s_get_users_by_ids(self, request: Request, db: AsyncSession, ids: list[str]) -> dict:
+        """
+        Get users by ids with one ``WHERE id = ANY(:ids)`` query for the ids not cached.
+
+        ``users`` follows the order of ``ids``, with ``null`` for ids that do not exist,
+        which are also listed in ``not_found``.
+        """
+        found = {}
+        for user_id in dict.fromkeys(ids):
+            user_data = await user_cache.get(user_id)
+            if user_data is not None:
+                found[user_id] = user_data
+
+        missing = [uuid.UUID(user_id) for user_id in dict.fromkeys(ids) if user_id not in found]
+        if missing:
+            # Read from the primary, the rows fill the cache
+            ids_param = bindparam("ids", missing, type_=ARRAY(UUID(as_uuid=True)))
+            query = select(User).options(USER_PROJECTION).where(User.id == any_(ids_param))
+            users = await db.scalars(query)
+
+            for user_data in trusted_dump_list(UserSerializer, users):
+                found[user_data["id"]] = user_data
+                await user_cache.set(user_data["id"], user_data)
+
+        return {
+            "users": [found.get(user_id) for user_id in ids],
+            "not_found": [user_id for user_id in dict.fromkeys(ids) if user_id not in found],
+        }
+
+    async def s_login(self, request: Request, db: AsyncSession) -> dict:
         """Login a user."""
         # Get data from request
         the_data = await the_query(request)
@@ -116,16 +495,23 @@ class UserService:
         password = the_data.get("password")
 
         # Find user by email
-        user = db.query(User).filter(User.email == email).first()
+        user = await db.scalar(select(User).where(User.email == email))
         if not user:
             logger.error("Invalid credentials for user %s", email)
             raise UnauthorizedException(message="Invalid credentials")
 
         # Verify password
-        if not compare_hashed_password(password, user.password):
+        if not await password_hasher.verify(password, user.password):
             logger.error("Invalid credentials for user %s", email)
             raise UnauthorizedException(message="Invalid credentials")
 
+        # Upgrade the hash when the configured bcrypt cost has changed
+        if password_hasher.needs_rehash(user.password):
+            user.password = await password_hasher.hash(password)
+            password_hasher.counters.incr("rehashes")
+            await db.commit()
+            await db.refresh(user)
+
         # Create token payload
         token_payload = {
             "user_id": str(user.id),
@@ -138,7 +524,7 @@ class UserService:
         access_token = create_access_token(token_payload)
         refresh_token = create_refresh_token(token_payload)
 
-        user_data = get_serialize_data(UserLoginSerializer, user.as_dict())
+        user_data = trusted_dump(UserLoginSerializer, user)
 
         logger.info(
             "Login successful for user %s",
@@ -155,71 +541,114 @@ class UserService:
             "refresh_token": refresh_token,
         }
 
-    async def s_update_user(self, request: Request, db: Session, user_id: str) -> dict:
-        """Update a user."""
+    async def s_update_user(self, request: Request, db: AsyncSession, user_id: str) -> dict:
+        """Update a user with a single ``UPDATE ... RETURNING``."""
         the_data = await the_query(request)
-        user = db.query(User).filter(User.id == user_id).first()
-
-        if not user:
-            raise ItemNotFoundException(message="User not found")
 
+        values = {}
         if the_data.get("name"):
-            user.name = the_data.get("name")
+            values["name"] = the_data.get("name")
         if the_data.get("email"):
-            user.email = the_data.get("email")
+            values["email"] = the_data.get("email")
         if the_data.get("password"):
-            user.password = generate_password_hash(the_data.get("password"))
-        db.commit()
-        db.refresh(user)
+            values["password"] = await password_hasher.hash(the_data.get("password"))
+
+        if values:
+            query = update(User).where(User.id == user_id).values(**values).returning(User)
+        else:
+            query = select(User).where(User.id == user_id)
+        user = await db.scalar(query)
+
+        if not user:
+            raise ItemNotFoundException(message="User not found")
+
+        if values:
+            await self._adjust_status_count(db, user.status, 0)
+        await db.commit()
+        if values:
+            await self._invalidate_user(user_id)
 
-        user_data = get_serialize_data(UserSerializer, user.as_dict())
+        user_data = trusted_dump(UserSerializer, user)
         return {
             "success": True,
             "message": "User updated successfully",
             "user": user_data,
         }
 
-    async def s_delete_user(self, request: Request, db: Session, user_id: str) -> dict:
-        """Delete a user."""
-        user = db.query(User).filter(User.id == user_id).first()
-        if not user:
+    async def s_delete_user(self, request: Request, db: AsyncSession, user_id: str) -> dict:
+        """
+        Delete a user with a single ``DELETE ... RETURNING``.
+
+        With ``USER_SOFT_DELETE`` the row only gets ``deleted_at`` set, which hides it from every
+        read, and the ``purge_soft_deleted_users`` task removes it later.
+        """
+        if USER_SOFT_DELETE:
+            query = update(User).where(User.id == user_id).values(deleted_at=func.now())
+        else:
+            query = delete(User).where(User.id == user_id)
+        result = await db.execute(query.returning(User.status))
+        deleted = result.one_or_none()
+        if deleted is None:
             raise ItemNotFoundException(message="User not found")
-        db.delete(user)
-        db.commit()
+
+        await self._adjust_status_count(db, deleted.status, -1)
+        await db.commit()
+        await self._invalidate_user(user_id)
         return {
             "success": True,
             "message": "User deleted successfully",
         }
 
-    async def s_raw_sql_get_users(self, request: Request, db: Session) -> dict:
-        """Get users using raw SQL."""
-        the_sql_content = load_sql_file("users.fetch-all-users")
-        # Execute the raw SQL query using SQLAlchemy with text()
-        result = db.execute(the_sql_content)
-
-        users_list = raw_sql_fetch_all(result)
-
-        def additional_data(data: list) -> dict:
-            total_active_users = len([user for user in data if user["status"] == "active"])
-            total_inactive_users = len([user for user in data if user["status"] == "inactive"])
-            return {"active_users": total_active_users, "inactive_users": total_inactive_users}
-
-        paginated_users_list = raw_sql_rest_paginate(
-            request=request,
-            query_data=users_list,
-            serializer=UserSerializer,
-            wrap="users",
-            additional_data=additional_data,
+    async def s_purge_deleted_users(
+        self, db: AsyncSession, deleted_before: datetime, batch_size: int
+    ) -> int:
+        """Hard delete one batch of users soft deleted before ``deleted_before``."""
+        batch = (
+            select(User.id)
+            .where(User.deleted_at < deleted_before)
+            .order_by(User.deleted_at)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        query = delete(User).where(User.id.in_(batch))
+        result = await db.execute(
+            query.execution_options(include_deleted=True, synchronize_session=False)
         )
-        return paginated_users_list
+        await db.commit()
+        return result.rowcount
 
-    async def s_raw_sql_get_user_by_id(self, request: Request, db: Session, user_id: str) -> dict:
+    async def s_raw_sql_get_users(self, request: Request, db: AsyncSession) -> dict:
+        """Get users using raw SQL."""
+        the_sql_content = sql_registry.get("users.fetch-all-users")
+
+        # LIMIT/OFFSET (or the keyset cursor) and the count run in SQL, one page is read
+        with replica_reads(db):
+            additional_data = await self._status_counts(db)
+
+            return await raw_sql_paginate(
+                request,
+                db,
+                the_sql_content,
+                serializer=UserSerializer,
+                wrap="users",
+                additional_data=additional_data,
+            )
+
+    async def s_raw_sql_get_user_by_id(
+        self, request: Request, db: AsyncSession, user_id: str
+    ) -> dict:
         """Get user by id using raw SQL."""
-        sql_query = load_sql_file("users.fetch-single-user", sql_vars={"user_id": user_id})
-        result = db.execute(sql_query)
+        user = await user_cache.get(user_id)
+        if user is not None:
+            return user
+
+        # Read from the primary, the row fills the cache
+        result = await sql_registry.execute(db, "users.fetch-single-user", {"user_id": user_id})
         user = raw_sql_fetch_one(result, serializer=UserSerializer)
 
         if not user:
             raise ItemNotFoundException(message="User not found")
 
+        await user_cache.set(user_id, user)
         return user
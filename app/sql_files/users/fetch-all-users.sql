@@ -1 +1 @@
-select * from users;
\ No newline at end of file
+select id, name, email, status from users where deleted_at is null;
\ No newline at end of file
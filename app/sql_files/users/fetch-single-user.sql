@@ -1 +1 @@
-select * from users where id = --sql_var:user_id;
\ No newline at end of file
+select id, name, email, status from users where id = --sql_var:user_id and deleted_at is null;
\ No newline at end of file
@@ -0,0 +1,51 @@
+"""User maintenance tasks."""
+
+import asyncio
+import os
+from datetime import UTC, datetime, timedelta
+
+from dotenv import load_dotenv
+
+from app.lib.database import AsyncSessionLocal
+from app.services.user_service import UserService
+from app.taskiq import get_taskiq_broker
+
+load_dotenv()
+
+tskq_broker = get_taskiq_broker()
+
+# Soft deleted users are hard deleted after this many days, off peak, in small batches
+USER_PURGE_AFTER_DAYS = int(os.getenv("USER_PURGE_AFTER_DAYS", "30"))
+USER_PURGE_CRON = os.getenv("USER_PURGE_CRON", "30 3 * * *")
+USER_PURGE_BATCH_SIZE = int(os.getenv("USER_PURGE_BATCH_SIZE", "500"))
+USER_PURGE_BATCH_PAUSE_SECONDS = float(os.getenv("USER_PURGE_BATCH_PAUSE_SECONDS", "1"))
+USER_PURGE_MAX_BATCHES = int(os.getenv("USER_PURGE_MAX_BATCHES", "200"))
+
+
+@tskq_broker.task(
+    task_name="purge_soft_deleted_users",
+    schedule=[{"cron": USER_PURGE_CRON}],
+)
+async def purge_soft_deleted_users(data: dict | None = None) -> dict:
+    """Hard delete soft deleted users in throttled batches."""
+    data = data or {}
+    after_days = int(data.get("after_days", USER_PURGE_AFTER_DAYS))
+    deleted_before = datetime.now(UTC) - timedelta(days=after_days)
+
+    purged = 0
+    async with AsyncSessionLocal() as db:
+        for _ in range(USER_PURGE_MAX_BATCHES):
+            batch_purged = await UserService().s_purge_deleted_users(
+                db, deleted_before, USER_PURGE_BATCH_SIZE
+            )
+            purged += batch_purged
+            if batch_purged < USER_PURGE_BATCH_SIZE:
+                break
+            # Leave room for the autovacuum and the regular traffic between batches
+            await asyncio.sleep(USER_PURGE_BATCH_PAUSE_SECONDS)
+
+    return {
+        "status": "completed",
+        "purged": purged,
+        "deleted_before": deleted_before.isoformat(),
+    }
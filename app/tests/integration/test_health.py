@@ -17,3 +17,43 @@ def test_the_index(client):
     response = client.get("/the-index")
     assert response.status_code == status.HTTP_200_OK
     assert response.json() == {"message": "FastAPI is running..."}
+
+
+def test_db_pool_metrics(client, auth_headers):
+    response = client.get("/metrics/db-pool", headers=auth_headers)
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert set(data) == {"async", "sync", "replicas"}
+    assert "checked_out" in data["async"]
+    assert "wait_time_seconds" in data["async"]
+
+
+def test_password_hasher_metrics(client, auth_headers):
+    response = client.get("/metrics/password-hasher", headers=auth_headers)
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert "queued" in data
+    assert "run_time_seconds" in data
+
+
+def test_user_cache_metrics(client, auth_headers):
+    response = client.get("/metrics/user-cache", headers=auth_headers)
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert {"hits", "misses", "evictions"} <= set(data)
+
+
+def test_token_cache_metrics(client, auth_headers):
+    client.get("/metrics/token-cache", headers=auth_headers)
+    response = client.get("/metrics/token-cache", headers=auth_headers)
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert {"hits", "misses", "hit_rate", "verifications", "revoked"} <= set(data)
+    assert data["hits"] >= 1
+
+
+def test_jwks_is_public(client):
+    response = client.get("/.well-known/jwks.json")
+    assert response.status_code == status.HTTP_200_OK
+    # Tokens are signed with the shared secret by default, it is never published
+    assert response.json() == {"keys": []}
@@ -1,3 +1,5 @@
+import json
+
 from fastapi import status
 
 
@@ -24,3 +26,117 @@ def test_user_login(client):
     assert data["message"] == "Login successful"
     assert "access_token" in data
     assert "refresh_token" in data
+
+
+def test_get_users_cursor_pagination(client, auth_headers):
+    response = client.get(
+        "/api/v1/users", params={"pagination": "cursor", "per_page": 1}, headers=auth_headers
+    )
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert len(data["users"]) == 1
+    assert "last_page" not in data
+    assert data["next_cursor"] is not None or data["has_more"] is False
+
+
+def test_raw_sql_get_users_paginates_in_sql(client, auth_headers):
+    response = client.get("/api/v1/users/raw-sql/users", params={"per_page": 1}, headers=auth_headers)
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert len(data["users"]) == 1
+    assert data["total"] >= 1
+    assert "active_users" in data["additional_data"]
+
+
+def test_import_users_ndjson(client, auth_headers):
+    body = '{"email": "bulk-1@example.com", "password": "password123"}\n{"email": "bad"}\n'
+    response = client.post(
+        "/api/v1/users/import",
+        content=body,
+        headers={**auth_headers, "Content-Type": "application/x-ndjson"},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["imported"] == 1
+    assert data["failed"] == 1
+    assert data["errors"][0]["line"] == 2
+
+    users = client.get("/api/v1/users", params={"per_page": 100}, headers=auth_headers).json()
+    bulk_user = next(user for user in users["users"] if user["email"] == "bulk-1@example.com")
+    client.delete(f"/api/v1/users/{bulk_user['id']}/delete", headers=auth_headers)
+
+
+def test_export_users_ndjson(client, auth_headers):
+    response = client.get("/api/v1/users/export", headers=auth_headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = response.text.splitlines()
+    assert lines
+    assert set(json.loads(lines[0])) == {"id", "name", "email", "status"}
+
+
+def test_export_users_csv(client, auth_headers):
+    response = client.get("/api/v1/users/export", params={"format": "csv"}, headers=auth_headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/csv")
+    assert response.text.splitlines()[0] == "id,name,email,status"
+
+
+def test_get_users_by_ids(client, auth_headers):
+    nonexistent_uuid = "123e4567-e89b-12d3-a456-426614174000"
+    response = client.post(
+        "/api/v1/users/batch", json={"ids": [nonexistent_uuid]}, headers=auth_headers
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"users": [None], "not_found": [nonexistent_uuid]}
+
+    response = client.post("/api/v1/users/batch", json={"ids": ["not-a-uuid"]}, headers=auth_headers)
+    assert response.status_code == 422
+
+
+def test_get_user_conditional_get(client, auth_headers):
+    users = client.get("/api/v1/users", headers=auth_headers)
+    assert users.headers["cache-control"] == "private, no-cache"
+    etag = users.headers["etag"]
+
+    response = client.get("/api/v1/users", headers={**auth_headers, "If-None-Match": etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.content == b""
+
+    user_id = users.json()["users"][0]["id"]
+    response = client.get(f"/api/v1/users/{user_id}", headers=auth_headers)
+    user_etag = response.headers["etag"]
+    response = client.get(
+        f"/api/v1/users/{user_id}", headers={**auth_headers, "If-None-Match": user_etag}
+    )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    # A write changes both validators
+    client.put(f"/api/v1/users/{user_id}/update", json={"name": "ETag Name"}, headers=auth_headers)
+    response = client.get(
+        f"/api/v1/users/{user_id}", headers={**auth_headers, "If-None-Match": user_etag}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["etag"] != user_etag
+    response = client.get("/api/v1/users", headers={**auth_headers, "If-None-Match": etag})
+    assert response.status_code == status.HTTP_200_OK
+
+
+def test_get_users_sparse_fieldsets(client, auth_headers):
+    response = client.get("/api/v1/users?fields=id,name", headers=auth_headers)
+    assert response.status_code == status.HTTP_200_OK
+    users = response.json()["users"]
+    assert users
+    assert all(set(user) == {"id", "name"} for user in users)
+
+    response = client.get("/api/v1/users?pagination=cursor&fields=name", headers=auth_headers)
+    assert all(set(user) == {"name"} for user in response.json()["users"])
+
+    user_id = users[0]["id"]
+    full = client.get(f"/api/v1/users/{user_id}", headers=auth_headers)
+    response = client.get(f"/api/v1/users/{user_id}?fields=email", headers=auth_headers)
+    assert response.json() == {"email": full.json()["email"]}
+    assert response.headers["etag"] != full.headers["etag"]
+
+    response = client.get("/api/v1/users?fields=id,password", headers=auth_headers)
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,102 @@
+from fastapi import FastAPI, Request, status
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from fastapi_pundra.common.jwt_utils import create_access_token
+
+from app.lib import jwt_keys
+
+from app.lib.path_exclusions import compile_exclusions, public
+from app.middleware.authorization_middleware import AuthorizationMiddleware
+
+
+def make_client():
+    app = FastAPI()
+
+    @app.get("/health")
+    async def health() -> dict:
+        return {"status": "ok"}
+
+    @app.get("/me")
+    async def me(request: Request) -> dict:
+        return {"user": request.state.user, "auth_user_id": request.state.auth_user_id}
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def chunks():
+            for i in range(3):
+                yield f"{i}\n"
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    @app.get("/public/{slug}")
+    @public
+    async def public_route(slug: str) -> dict:
+        return {"slug": slug}
+
+    exclusions = compile_exclusions(app.routes, exact=["/health"])
+    app.add_middleware(AuthorizationMiddleware, exclusions=exclusions)
+    return TestClient(app)
+
+
+def test_excluded_paths_skip_authorization():
+    client = make_client()
+    assert client.get("/health").status_code == status.HTTP_200_OK
+    assert client.get("/health/").status_code == status.HTTP_200_OK
+    assert client.get("/public/anything").json() == {"slug": "anything"}
+
+
+def test_token_payload_is_added_to_request_state():
+    token = create_access_token({"user_id": "user-1"})
+    response = make_client().get("/me", headers={"Authorization": f"Bearer {token}"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["auth_user_id"] == "user-1"
+    assert response.json()["user"]["user_id"] == "user-1"
+
+
+def test_asymmetric_tokens_are_verified_with_the_key_set(tmp_path, monkeypatch):
+    pem = ec.generate_private_key(ec.SECP256R1()).private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    (tmp_path / "key-1.pem").write_bytes(pem)
+    monkeypatch.setattr(jwt_keys, "key_set", jwt_keys.KeySet(tmp_path, "ES256"))
+
+    token = jwt_keys.create_access_token({"user_id": "user-1"})
+    client = make_client()
+    response = client.get("/me", headers={"Authorization": f"Bearer {token}"})
+    assert response.json()["auth_user_id"] == "user-1"
+
+    # Tokens signed with the shared secret are refused once the key set signs
+    token = create_access_token({"user_id": "user-2"})
+    response = client.get("/me", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def test_streamed_responses_pass_through():
+    token = create_access_token({"user_id": "user-1"})
+    response = make_client().get("/stream", headers={"Authorization": f"Bearer {token}"})
+    assert response.text == "0\n1\n2\n"
+
+
+def test_unauthorized_error_json():
+    client = make_client()
+    cases = {
+        None: "No authorization header",
+        "Basic abc": "Invalid authentication scheme",
+        "Bearer": "Invalid authentication scheme",
+        "Bearer not-a-token": "Invalid token",
+    }
+    for header, message in cases.items():
+        headers = {"Authorization": header} if header else {}
+        response = client.get("/me", headers=headers)
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        body = response.json()
+        assert body["message"] == message
+        assert body["path"] == "/me"
+        assert body["type"] == "UnauthorizedException"
+        assert "timestamp" in body
@@ -0,0 +1,61 @@
+import pytest
+
+from app.lib.bulk_import import import_format, iter_batches, iter_lines, iter_records, validation_errors
+from app.schemas.user_schema import UserCreateSchema
+
+
+async def agen(items):
+    for item in items:
+        yield item
+
+
+async def collect(aiter):
+    return [item async for item in aiter]
+
+
+@pytest.mark.asyncio
+async def test_iter_lines_splits_across_chunks():
+    chunks = [b"a,b\r\n1,", "é".encode()[:1], "é".encode()[1:] + b"\n\n2,x"]
+    assert await collect(iter_lines(agen(chunks))) == ["a,b", "1,é", "", "2,x"]
+
+
+@pytest.mark.asyncio
+async def test_iter_records_csv():
+    lines = ["email,name,password", "a@example.com,,password123", "", "broken", "b@example.com,B,x"]
+    records = await collect(iter_records(agen(lines), "csv"))
+    assert records == [
+        (2, {"email": "a@example.com", "name": None, "password": "password123"}),
+        (4, None),
+        (5, {"email": "b@example.com", "name": "B", "password": "x"}),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_iter_records_ndjson():
+    lines = ['{"email": "a@example.com"}', "not json", "[1]"]
+    records = await collect(iter_records(agen(lines), "ndjson"))
+    assert records == [(1, {"email": "a@example.com"}), (2, None), (3, None)]
+
+
+@pytest.mark.asyncio
+async def test_iter_batches():
+    batches = await collect(iter_batches(agen(range(5)), 2))
+    assert batches == [[0, 1], [2, 3], [4]]
+
+
+def test_validation_errors():
+    data, errors = validation_errors(UserCreateSchema, {"email": "a@example.com", "password": "password123"})
+    assert data.email == "a@example.com"
+    assert errors == {}
+
+    data, errors = validation_errors(UserCreateSchema, {"email": "nope", "password": "short"})
+    assert data is None
+    assert set(errors) == {"email", "password"}
+
+    assert validation_errors(UserCreateSchema, None) == (None, {"line": ["line could not be parsed"]})
+
+
+def test_import_format():
+    assert import_format("application/x-ndjson") == "ndjson"
+    assert import_format(None, "users.jsonl") == "ndjson"
+    assert import_format("text/csv") == "csv"
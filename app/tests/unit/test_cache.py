@@ -0,0 +1,58 @@
+from unittest.mock import patch
+
+import pytest
+
+from app.lib.cache import LRUCache, TwoTierCache
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(max_size=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.counters.snapshot() == {"hits": 3, "misses": 1, "evictions": 1, "expirations": 0}
+
+
+def test_lru_cache_expires_entries():
+    cache = LRUCache(max_size=2, ttl=10)
+    with patch("app.lib.cache.time.monotonic", return_value=100):
+        cache.set("a", 1)
+    with patch("app.lib.cache.time.monotonic", return_value=111):
+        assert cache.get("a") is None
+
+    assert len(cache) == 0
+    assert cache.counters.get("expirations") == 1
+
+
+@pytest.mark.asyncio
+async def test_two_tier_cache_invalidate():
+    cache = TwoTierCache("test", max_size=10, ttl=60)
+    await cache.set("a", {"name": "A"})
+    assert await cache.get("a") == {"name": "A"}
+
+    await cache.invalidate("a")
+    assert await cache.get("a") is None
+    assert cache.snapshot()["invalidations"] == 1
+
+
+@pytest.mark.asyncio
+async def test_two_tier_cache_disabled():
+    cache = TwoTierCache("test", max_size=10, ttl=60, enabled=False)
+    await cache.set("a", 1)
+    assert await cache.get("a") is None
+
+
+@pytest.mark.asyncio
+async def test_two_tier_cache_survives_redis_outage():
+    cache = TwoTierCache("test", max_size=10, ttl=60, redis_url="redis://127.0.0.1:1/0")
+    assert await cache.get("a") is None
+    await cache.set("a", 1)
+    await cache.invalidate("a")
+
+    assert await cache.get("a") is None
+    assert cache.snapshot()["redis_errors"] >= 3
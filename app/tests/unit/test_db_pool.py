@@ -0,0 +1,41 @@
+import pytest
+from sqlalchemy import create_engine, exc, text
+
+from app.lib.db_pool import InstrumentedQueuePool, pool_status
+from app.lib.metrics import Histogram
+from app.tests.conftest import TEST_DATABASE_URL
+
+
+def test_histogram_snapshot_is_cumulative():
+    histogram = Histogram(buckets=(0.1, 1.0))
+    histogram.observe(0.05)
+    histogram.observe(0.5)
+    histogram.observe(5)
+
+    snapshot = histogram.snapshot()
+    assert snapshot["buckets"] == {"0.1": 1, "1.0": 2, "+Inf": 3}
+    assert snapshot["count"] == 3
+
+
+def test_instrumented_pool_records_checkouts_and_timeouts():
+    engine = create_engine(
+        TEST_DATABASE_URL,
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.1,
+    )
+    with engine.connect() as connection:
+        connection.execute(text("select 1"))
+        assert pool_status(engine)["checked_out"] == 1
+
+        with pytest.raises(exc.TimeoutError):
+            engine.connect()
+
+    status = pool_status(engine)
+    assert status["checked_out"] == 0
+    assert status["checkouts"] == 1
+    assert status["checkout_timeouts"] == 1
+    assert status["checkout_failures"] == 1
+    assert status["wait_time_seconds"]["count"] == 1
+    engine.dispose()
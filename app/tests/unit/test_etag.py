@@ -0,0 +1,35 @@
+from unittest.mock import Mock
+
+from fastapi import Request
+
+from app.lib.etag import is_not_modified, make_etag, not_modified_response
+
+
+def request_with(if_none_match=None):
+    request = Mock(spec=Request)
+    request.headers = {"if-none-match": if_none_match} if if_none_match else {}
+    return request
+
+
+def test_make_etag_is_strong_and_stable():
+    etag = make_etag("user", 1, None)
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag == make_etag("user", 1, None)
+    assert etag != make_etag("user", 2, None)
+
+
+def test_is_not_modified():
+    etag = make_etag("user", 1)
+    assert not is_not_modified(request_with(), etag)
+    assert is_not_modified(request_with(etag), etag)
+    assert is_not_modified(request_with(f'"other", W/{etag}'), etag)
+    assert is_not_modified(request_with("*"), etag)
+    assert not is_not_modified(request_with('"other"'), etag)
+
+
+def test_not_modified_response():
+    response = not_modified_response('"abc"', "private, no-cache")
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["etag"] == '"abc"'
+    assert response.headers["cache-control"] == "private, no-cache"
@@ -0,0 +1,90 @@
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+from jose import JWTError, jwt
+
+from app.lib.jwt_keys import KeySet
+
+
+def write_key(keys_dir, kid, private_key, *, public_only=False):
+    if public_only:
+        pem = private_key.public_key().public_bytes(
+            serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+        )
+        (keys_dir / f"{kid}.pub.pem").write_bytes(pem)
+        return
+    pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    (keys_dir / f"{kid}.pem").write_bytes(pem)
+
+
+@pytest.fixture
+def rsa_keys(tmp_path):
+    write_key(tmp_path, "2024", rsa.generate_private_key(65537, 2048), public_only=True)
+    write_key(tmp_path, "2025", rsa.generate_private_key(65537, 2048))
+    return tmp_path
+
+
+def test_tokens_are_signed_with_the_active_kid(rsa_keys):
+    key_set = KeySet(rsa_keys, "RS256", active_kid="2025")
+    token = key_set.encode({"user_id": "user-1"})
+
+    assert jwt.get_unverified_header(token) == {"alg": "RS256", "kid": "2025", "typ": "JWT"}
+    assert key_set.decode(token) == {"user_id": "user-1"}
+
+
+def test_rotated_public_keys_still_verify(rsa_keys):
+    old_key = rsa.generate_private_key(65537, 2048)
+    write_key(rsa_keys, "2024", old_key, public_only=True)
+    old_pem = old_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    token = jwt.encode({"user_id": "user-1"}, old_pem, algorithm="RS256", headers={"kid": "2024"})
+
+    assert KeySet(rsa_keys, "RS256").decode(token) == {"user_id": "user-1"}
+
+
+def test_unknown_kid_and_foreign_keys_are_refused(rsa_keys, tmp_path_factory):
+    key_set = KeySet(rsa_keys, "RS256", active_kid="2025")
+    foreign_dir = tmp_path_factory.mktemp("foreign")
+    write_key(foreign_dir, "2025", rsa.generate_private_key(65537, 2048))
+    foreign_token = KeySet(foreign_dir, "RS256").encode({"user_id": "user-1"})
+    unknown_kid = jwt.encode({"user_id": "user-1"}, "secret", headers={"kid": "other"})
+
+    for token in (foreign_token, unknown_kid, ""):
+        with pytest.raises(JWTError):
+            key_set.decode(token)
+
+
+def test_keys_are_parsed_once(rsa_keys):
+    key_set = KeySet(rsa_keys, "RS256")
+    key_set.encode({"user_id": "user-1"})
+    (rsa_keys / "2025.pem").unlink()
+
+    # The parsed keys are kept, the directory is only read again by load()
+    assert key_set.decode(key_set.encode({"user_id": "user-1"}))["user_id"] == "user-1"
+    with pytest.raises(ValueError, match="No private key"):
+        key_set.load().signing_key()
+
+
+def test_missing_active_kid_is_refused(rsa_keys):
+    with pytest.raises(ValueError, match="JWT_ACTIVE_KID"):
+        KeySet(rsa_keys, "RS256", active_kid="2030").load()
+
+
+def test_jwks_publishes_the_public_keys(tmp_path):
+    write_key(tmp_path, "ec-1", ec.generate_private_key(ec.SECP256R1()))
+    key_set = KeySet(tmp_path, "ES256")
+
+    (jwk,) = key_set.jwks()["keys"]
+    assert jwk["kid"] == "ec-1"
+    assert jwk["alg"] == "ES256"
+    assert jwk["use"] == "sig"
+    assert jwk["kty"] == "EC"
+    assert "d" not in jwk
+    assert key_set.decode(key_set.encode({"user_id": "user-1"}))["user_id"] == "user-1"
@@ -0,0 +1,167 @@
+import json
+import uuid
+
+import pytest
+from unittest.mock import Mock
+from fastapi import Request
+from fastapi_pundra.rest.exceptions import BadRequestException
+from sqlalchemy import func, select, text
+from sqlalchemy.dialects import postgresql
+
+from app.lib.pagination import (
+    cursor_paginate,
+    encode_cursor,
+    keyset_order_by,
+    keyset_ranges,
+    offset_paginate,
+    page_url_builder,
+    parse_sort,
+)
+from app.lib.soft_delete import exclude_soft_deleted
+from app.models.users import User
+from app.serializers.user_serializer import UserSerializer
+from app.tests.factories.user_factory import UserFactory
+
+
+def make_request(**query_params):
+    request = Mock(spec=Request)
+    request.query_params = query_params
+    request.url = "http://testserver/api/v1/users"
+    request.base_url = "http://testserver/"
+    return request
+
+
+async def paginate_users(request, async_db):
+    return await cursor_paginate(
+        request, async_db, select(User), model=User, serializer=UserSerializer
+    )
+
+
+def test_parse_sort_adds_id_tiebreaker_and_skips_unknown_columns():
+    sort_keys = parse_sort(User, "-name,unknown,email")
+    assert [(column.key, descending) for column, descending in sort_keys] == [
+        ("name", True),
+        ("email", False),
+        ("id", False),
+    ]
+
+
+def test_page_url_builder_keeps_the_query_parameters():
+    build_url = page_url_builder(make_request(q="ann", cursor="abc"), per_page=5)
+
+    assert build_url(page=2) == "http://testserver/api/v1/users?q=ann&cursor=abc&per_page=5&page=2"
+    assert build_url(cursor=None) == "http://testserver/api/v1/users?q=ann&per_page=5"
+
+
+def test_parse_sort_rejects_columns_outside_allowed():
+    sort_keys = parse_sort(User, "-created_at,name", allowed=["name", "created_at"])
+    assert [column.key for column, _ in sort_keys] == ["created_at", "name", "id"]
+    with pytest.raises(BadRequestException):
+        parse_sort(User, "name,password", allowed=["name"])
+
+
+@pytest.mark.asyncio
+async def test_cursor_refuses_to_sort_by_password(async_db):
+    # The cursor would carry the password hash of the last row
+    request = make_request(pagination="cursor", sort="password", per_page="1")
+    with pytest.raises(BadRequestException, match="password"):
+        await paginate_users(request, async_db)
+
+
+@pytest.fixture
+def seeded_users(db):
+    users = [UserFactory(status="active") for _ in range(4)]
+    users.extend([UserFactory(status=None, name=None) for _ in range(3)])
+    for user in users:
+        db.add(user)
+    db.commit()
+    yield users
+    for user in users:
+        db.delete(user)
+    db.commit()
+
+
+@pytest.mark.asyncio
+async def test_cursor_rejects_cursor_for_another_sort(async_db):
+    cursor = encode_cursor("email", ["a@example.com", "123e4567-e89b-12d3-a456-426614174000"])
+    request = make_request(pagination="cursor", sort="name", cursor=cursor)
+    with pytest.raises(BadRequestException):
+        await paginate_users(request, async_db)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("sort", ["email", "name", "-name", "status,-created_at", "-status,name"])
+async def test_cursor_pages_cover_every_row_once(seeded_users, async_db, sort):
+    sort_keys = parse_sort(User, sort)
+    expected = (await async_db.scalars(select(User.id).order_by(*keyset_order_by(sort_keys)))).all()
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"pagination": "cursor", "sort": sort, "per_page": "3"}
+        if cursor:
+            params["cursor"] = cursor
+        page = await paginate_users(make_request(**params), async_db)
+        seen.extend(user.id for user in page["data"])
+        cursor = page["next_cursor"]
+        if not page["has_more"]:
+            break
+
+    assert seen == expected
+
+
+@pytest.mark.asyncio
+async def test_cursor_total_is_optional(seeded_users, async_db):
+    page = await paginate_users(make_request(), async_db)
+    assert "total" not in page
+
+    page = await paginate_users(make_request(with_total="true"), async_db)
+    assert page["total"] == await async_db.scalar(select(func.count(User.id)))
+
+
+def test_keyset_ranges_put_the_null_group_in_page_order():
+    sort_keys = parse_sort(User, "name")
+    after_value, in_nulls = keyset_ranges(sort_keys, ["ann", uuid.uuid4()])
+    assert "users.name >= " in str(after_value)
+    assert str(in_nulls) == "users.name IS NULL"
+    assert len(keyset_ranges(sort_keys, [None, uuid.uuid4()])) == 1
+
+    descending = parse_sort(User, "-name")
+    assert len(keyset_ranges(descending, ["ann", uuid.uuid4()])) == 1
+    assert len(keyset_ranges(descending, [None, uuid.uuid4()])) == 2
+
+
+@pytest.mark.asyncio
+async def test_cursor_seeks_the_sort_index(async_db):
+    sort_keys = parse_sort(User, "email")
+    seek = keyset_ranges(sort_keys, ["m@example.com", uuid.UUID(int=0)])[0]
+    query = exclude_soft_deleted(
+        select(User.id).where(seek).order_by(*keyset_order_by(sort_keys)).limit(3)
+    )
+    sql = query.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+
+    # The table is small, keep the planner off the sequential scan to see the index use
+    await async_db.execute(text("SET LOCAL enable_seqscan = off"))
+    plan = await async_db.scalar(text(f"EXPLAIN (FORMAT JSON) {sql}"))
+    await async_db.rollback()
+
+    plan = json.dumps(plan)
+    assert "ix_users_email_active" in plan
+    # The cursor is an index bound, not a filter applied to every row before it
+    assert '"Index Cond": "((email)::text >= ' in plan
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("per_page", ["0", "-1", "1000", "ten"])
+async def test_cursor_rejects_invalid_per_page(async_db, per_page):
+    request = make_request(pagination="cursor", per_page=per_page)
+    with pytest.raises(BadRequestException, match="per_page"):
+        await paginate_users(request, async_db)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("per_page", ["0", "-1"])
+async def test_offset_rejects_invalid_per_page(async_db, per_page):
+    request = make_request(per_page=per_page)
+    with pytest.raises(BadRequestException, match="per_page"):
+        await offset_paginate(request, async_db, select(User), serializer=UserSerializer)
@@ -0,0 +1,65 @@
+import asyncio
+
+import pytest
+
+from app.lib.password_hasher import PasswordHasher
+
+
+@pytest.fixture
+def hasher():
+    """Return a cheap hasher for tests."""
+    return PasswordHasher(rounds=4, max_workers=2)
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify(hasher):
+    hashed = await hasher.hash("password123")
+
+    assert hashed.startswith("$2b$04$")
+    assert await hasher.verify("password123", hashed)
+    assert not await hasher.verify("wrong_password", hashed)
+
+
+@pytest.mark.asyncio
+async def test_verify_rejects_malformed_hashes(hasher):
+    assert not await hasher.verify("password123", "hashed_abc")
+    assert not await hasher.verify("password123", None)
+
+
+@pytest.mark.asyncio
+async def test_hash_rejects_empty_password(hasher):
+    with pytest.raises(ValueError, match="empty"):
+        await hasher.hash("")
+
+
+def test_needs_rehash(hasher):
+    assert not hasher.needs_rehash("$2b$04$" + "a" * 53)
+    assert hasher.needs_rehash("$2b$12$" + "a" * 53)
+    assert hasher.needs_rehash("hashed_abc")
+
+
+@pytest.mark.asyncio
+async def test_snapshot_records_queue_and_run_times(hasher):
+    await asyncio.gather(*(hasher.hash("password123") for _ in range(4)))
+
+    snapshot = hasher.snapshot()
+    assert snapshot["hashes"] == 4
+    assert snapshot["queued"] == 0
+    assert snapshot["running"] == 0
+    assert snapshot["queue_time_seconds"]["count"] == 4
+    assert snapshot["run_time_seconds"]["count"] == 4
+
+
+@pytest.mark.asyncio
+async def test_batch_hashes_do_not_delay_interactive_ones():
+    hasher = PasswordHasher(rounds=8, max_workers=1, batch_workers=1)
+    batch = asyncio.create_task(hasher.hash_many(["password123"] * 20))
+    await asyncio.sleep(0.01)
+
+    hashed = await hasher.hash("password123")
+    assert not batch.done()
+    assert await hasher.verify("password123", hashed)
+
+    hashes = await batch
+    assert len(hashes) == 20
+    assert hasher.snapshot()["hashes"] == 21
@@ -0,0 +1,56 @@
+from fastapi import APIRouter, FastAPI
+
+from app.lib.path_exclusions import PathExclusions, compile_exclusions, public
+
+
+def test_exact_paths_ignore_the_trailing_slash():
+    exclusions = PathExclusions(exact=["/", "/health", "/docs/"])
+
+    assert exclusions.is_excluded("/")
+    assert exclusions.is_excluded("/health/")
+    assert exclusions.is_excluded("/docs")
+    assert not exclusions.is_excluded("/health/deep")
+    assert not exclusions.is_excluded("/api/v1/users")
+
+
+def test_prefixes_cover_whole_segments():
+    exclusions = PathExclusions(prefixes=["/static/", "/metrics"])
+
+    assert exclusions.is_excluded("/static")
+    assert exclusions.is_excluded("/static/css/app.css")
+    assert exclusions.is_excluded("/metrics/db-pool")
+    assert not exclusions.is_excluded("/metrics-private")
+    assert not exclusions.is_excluded("/api/static")
+
+
+def test_route_templates():
+    exclusions = PathExclusions(
+        templates=["/items/{item_id}", "/items/featured/list", "/files/{file_path:path}"]
+    )
+
+    assert exclusions.is_excluded("/items/42")
+    assert exclusions.is_excluded("/items/featured/list")
+    assert exclusions.is_excluded("/files/a/b/c.txt")
+    assert not exclusions.is_excluded("/items")
+    assert not exclusions.is_excluded("/items/42/edit")
+
+
+def test_compile_exclusions_finds_public_routes():
+    router = APIRouter(prefix="/api/v1")
+
+    @router.get("/open/{slug}")
+    @public
+    async def open_route(slug: str) -> dict:
+        return {}
+
+    @router.get("/closed")
+    async def closed_route() -> dict:
+        return {}
+
+    app = FastAPI()
+    app.include_router(router)
+    exclusions = compile_exclusions(app.routes, exact=["/health"])
+
+    assert exclusions.is_excluded("/api/v1/open/anything")
+    assert exclusions.is_excluded("/health")
+    assert not exclusions.is_excluded("/api/v1/closed")
@@ -0,0 +1,90 @@
+import pytest
+from unittest.mock import Mock
+from fastapi import Request
+from fastapi_pundra.rest.exceptions import BadRequestException
+from fastapi_pundra.common.raw_sql.utils import load_sql_file
+from sqlalchemy import func, select
+
+from app.lib.raw_sql import raw_sql_count, raw_sql_paginate
+from app.models.users import User
+from app.serializers.user_serializer import UserSerializer
+from app.tests.factories.user_factory import UserFactory
+
+
+def make_request(**query_params):
+    request = Mock(spec=Request)
+    request.query_params = query_params
+    request.url = "http://testserver/api/v1/users/raw-sql/users"
+    request.base_url = "http://testserver/"
+    return request
+
+
+@pytest.fixture
+def seeded_users(db):
+    users = [UserFactory() for _ in range(5)]
+    for user in users:
+        db.add(user)
+    db.commit()
+    yield users
+    for user in users:
+        db.delete(user)
+    db.commit()
+
+
+@pytest.mark.asyncio
+async def test_raw_sql_count_strips_trailing_semicolon(seeded_users, async_db):
+    sql = load_sql_file("users.fetch-all-users")
+    assert await raw_sql_count(async_db, sql) == await async_db.scalar(select(func.count(User.id)))
+
+
+@pytest.mark.asyncio
+async def test_raw_sql_offset_page_is_limited_in_sql(seeded_users, async_db):
+    sql = load_sql_file("users.fetch-all-users")
+    total = await async_db.scalar(select(func.count(User.id)))
+
+    page = await raw_sql_paginate(
+        make_request(page="2", per_page="2"), async_db, sql, serializer=UserSerializer, wrap="users"
+    )
+    expected_ids = (await async_db.scalars(select(User.id).order_by(User.id).offset(2).limit(2))).all()
+
+    assert page["total"] == total
+    assert page["current_page"] == 2
+    assert page["from"] == 3
+    assert [user["id"] for user in page["users"]] == [str(user_id) for user_id in expected_ids]
+
+
+@pytest.mark.asyncio
+async def test_raw_sql_page_is_at_least_one(seeded_users, async_db):
+    sql = load_sql_file("users.fetch-all-users")
+    page = await raw_sql_paginate(make_request(page="0", per_page="2"), async_db, sql)
+
+    assert page["current_page"] == 1
+    assert page["from"] == 1
+    assert page["prev_page_url"] is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("pagination", ["offset", "cursor"])
+async def test_raw_sql_rejects_invalid_per_page(async_db, pagination):
+    sql = load_sql_file("users.fetch-all-users")
+    request = make_request(pagination=pagination, per_page="0")
+    with pytest.raises(BadRequestException, match="per_page"):
+        await raw_sql_paginate(request, async_db, sql)
+
+
+@pytest.mark.asyncio
+async def test_raw_sql_cursor_pages_cover_every_row_once(seeded_users, async_db):
+    sql = load_sql_file("users.fetch-all-users")
+    expected_ids = (await async_db.scalars(select(User.id).order_by(User.id))).all()
+
+    seen = []
+    params = {"pagination": "cursor", "per_page": "2"}
+    while True:
+        page = await raw_sql_paginate(make_request(**params), async_db, sql, wrap="users")
+        seen.extend(user["id"] for user in page["users"])
+        if not page["has_more"]:
+            break
+        params["cursor"] = page["next_cursor"]
+
+    assert seen == [str(user_id) for user_id in expected_ids]
+    assert "total" not in page
@@ -0,0 +1,43 @@
+from collections import OrderedDict
+from datetime import UTC, datetime
+from decimal import Decimal
+from uuid import uuid4
+
+import orjson
+import pytest
+from pydantic import BaseModel
+
+from app.lib.responses import FastJSONResponse
+
+
+class Item(BaseModel):
+    name: str
+
+
+def test_renders_non_native_types():
+    user_id = uuid4()
+    created_at = datetime(2024, 1, 2, 3, 4, 5, tzinfo=UTC)
+    content = OrderedDict(
+        [
+            ("id", user_id),
+            ("created_at", created_at),
+            ("item", Item(name="a")),
+            ("price", Decimal("1.50")),
+            (1, "non string key"),
+        ]
+    )
+
+    body = orjson.loads(FastJSONResponse(content).body)
+
+    assert body == {
+        "id": str(user_id),
+        "created_at": "2024-01-02T03:04:05+00:00",
+        "item": {"name": "a"},
+        "price": "1.50",
+        "1": "non string key",
+    }
+
+
+def test_unknown_type_raises():
+    with pytest.raises(TypeError):
+        FastJSONResponse({"value": object()})
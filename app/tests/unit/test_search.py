@@ -0,0 +1,80 @@
+import uuid
+from unittest.mock import Mock
+
+import pytest
+from fastapi import Request
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.lib.search import like_escape, search_filter, search_paginate, search_window
+from app.models.users import User
+from app.serializers.user_serializer import UserSerializer
+from app.tests.factories.user_factory import UserFactory
+
+
+def test_like_escape():
+    assert like_escape("50%_off\\") == "50\\%\\_off\\\\"
+
+
+def test_search_filter_is_case_insensitive_substring():
+    sql = str(search_filter([User.name, User.email], "ann").compile(dialect=postgresql.dialect()))
+    assert "users.name ILIKE" in sql
+    assert "users.email ILIKE" in sql
+
+
+def test_search_window_bounds_every_relevance_group():
+    query = search_window(
+        select(User),
+        key=User.id,
+        columns=[User.name, User.email],
+        q="com",
+        order_by=[User.email],
+        max_window=50,
+    )
+    sql = str(query.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+    window = sql[sql.index("IN (SELECT") : sql.index("ORDER BY CASE")]
+
+    # Exact, prefix and substring matches are each limited before the ranking
+    assert window.count("LIMIT 50") == 3
+    assert "lower(users.name) = 'com'" in window
+    assert "lower(users.email) LIKE 'com" in window
+
+
+@pytest.fixture
+def saturated_users(db):
+    q = f"q{uuid.uuid4().hex[:8]}"
+    users = [UserFactory(name=f"zz {q} {i}") for i in range(20)]
+    users.append(UserFactory(name=f"{q} prefix"))
+    users.append(UserFactory(name=q.upper()))
+    for user in users:
+        db.add(user)
+    db.commit()
+    yield q
+    for user in users:
+        db.delete(user)
+    db.commit()
+
+
+@pytest.mark.asyncio
+async def test_search_window_keeps_the_most_relevant_matches(saturated_users, async_db):
+    q = saturated_users
+    request = Mock(spec=Request)
+    request.query_params = {"q": q, "per_page": "5"}
+    request.url = "http://testserver/api/v1/users"
+    request.base_url = "http://testserver/"
+
+    # 22 matches for a window of 5: the exact and prefix matches still come first
+    page = await search_paginate(
+        request,
+        async_db,
+        select(User),
+        key=User.id,
+        columns=[User.name, User.email],
+        serializer=UserSerializer,
+        order_by=[User.email, User.id],
+        max_window=5,
+    )
+    names = [user.name for user in page["data"]]
+    assert names[:2] == [q.upper(), f"{q} prefix"]
+    assert len(names) == 5
+    assert page["has_more"] is False
@@ -0,0 +1,44 @@
+import pytest
+from unittest.mock import Mock
+from fastapi import Request
+from fastapi_pundra.rest.exceptions import ItemNotFoundException
+
+from app.lib.sql_registry import SqlRegistry, sql_registry
+from app.services.user_service import UserService
+from app.tests.factories.user_factory import UserFactory
+
+
+def test_registry_compiles_sql_vars_into_bind_params(tmp_path):
+    (tmp_path / "users").mkdir()
+    (tmp_path / "users" / "by-email.sql").write_text(
+        "select * from users where email = --sql_var:email and status = --sql_var:status;"
+    )
+    registry = SqlRegistry(tmp_path).load()
+
+    statement = registry.get("users.by-email")
+    assert registry.names() == ["users.by-email"]
+    assert set(statement._bindparams) == {"email", "status"}
+    assert "--sql_var" not in statement.text
+
+
+def test_registry_rejects_unknown_names():
+    with pytest.raises(ValueError, match="Unknown SQL file"):
+        sql_registry.get("users.does-not-exist")
+
+
+@pytest.mark.asyncio
+async def test_raw_sql_get_user_by_id_uses_bind_params(db, async_db):
+    user = UserFactory()
+    db.add(user)
+    db.commit()
+
+    result = await UserService().s_raw_sql_get_user_by_id(Mock(spec=Request), async_db, str(user.id))
+    assert result["email"] == user.email
+
+    with pytest.raises(ItemNotFoundException):
+        await UserService().s_raw_sql_get_user_by_id(
+            Mock(spec=Request), async_db, "123e4567-e89b-12d3-a456-426614174000"
+        )
+
+    db.delete(user)
+    db.commit()
@@ -0,0 +1,74 @@
+import time
+from unittest.mock import Mock
+
+import pytest
+from fastapi_pundra.common.jwt_utils import create_access_token, decode_token
+from jose import JWTError
+
+from app.lib.token_cache import VerifiedTokenCache
+
+
+def test_verified_payload_is_reused():
+    cache = VerifiedTokenCache(max_size=10, ttl=60)
+    decode = Mock(wraps=decode_token)
+    token = create_access_token({"user_id": "user-1"})
+
+    first = cache.verify(token, decode)
+    second = cache.verify(token, decode)
+
+    assert first == second
+    assert first["user_id"] == "user-1"
+    assert decode.call_count == 1
+    # Callers get their own copy of the cached payload
+    second["user_id"] = "changed"
+    assert cache.verify(token, decode)["user_id"] == "user-1"
+    assert cache.snapshot()["hits"] == 2
+
+
+def test_invalid_tokens_are_not_cached():
+    cache = VerifiedTokenCache(max_size=10, ttl=60)
+    for _ in range(2):
+        with pytest.raises(JWTError):
+            cache.verify("not-a-token", decode_token)
+    assert cache.snapshot()["verifications"] == 2
+    assert cache.snapshot()["size"] == 0
+
+
+def test_cached_token_expires_with_exp():
+    cache = VerifiedTokenCache(max_size=10, ttl=60)
+    payloads = iter([{"user_id": "user-1", "exp": time.time() + 0.05}])
+
+    def decode(token):
+        payload = next(payloads, None)
+        if payload is None:
+            raise JWTError("Signature has expired")
+        return payload
+
+    assert cache.verify("token", decode)["user_id"] == "user-1"
+    time.sleep(0.06)
+    with pytest.raises(JWTError):
+        cache.verify("token", decode)
+    assert cache.snapshot()["expired"] == 1
+
+
+def test_revoked_token_is_refused():
+    cache = VerifiedTokenCache(max_size=10, ttl=60)
+    token = create_access_token({"user_id": "user-1"})
+    cache.verify(token, decode_token)
+
+    cache.revoke(token)
+    with pytest.raises(JWTError):
+        cache.verify(token, decode_token)
+    assert cache.snapshot()["revoked"] == 1
+
+    cache.clear()
+    assert cache.verify(token, decode_token)["user_id"] == "user-1"
+
+
+def test_disabled_cache_always_verifies():
+    cache = VerifiedTokenCache(max_size=10, ttl=60, enabled=False)
+    decode = Mock(wraps=decode_token)
+    token = create_access_token({"user_id": "user-1"})
+    cache.verify(token, decode)
+    cache.verify(token, decode)
+    assert decode.call_count == 2
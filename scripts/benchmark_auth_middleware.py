@@ -0,0 +1,123 @@
+"""
+Benchmark of the authorization middleware: pure ASGI against ``BaseHTTPMiddleware``.
+
+Both run in the real application, in process (no network), on the health route and on
+the user detail route served from the user cache, so no database is needed.
+
+    uv run python scripts/benchmark_auth_middleware.py --requests 5000
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import httpx
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import JSONResponse
+from fastapi_pundra.rest.exceptions import UnauthorizedException
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.config.authorization import EXCLUDE_PATHS
+from app.lib.cache import user_cache
+from app.lib.etag import make_etag
+from app.lib.jwt_keys import create_access_token
+from app.main import create_application
+from app.middleware.authorization_middleware import AuthorizationMiddleware
+
+
+class BaseHTTPAuthorizationMiddleware(BaseHTTPMiddleware):
+    """The previous ``BaseHTTPMiddleware`` implementation, kept for the comparison."""
+
+    async def dispatch(
+        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
+    ) -> Response:
+        """Dispatch the middleware."""
+        try:
+            request_path = request.url.path.rstrip("/")
+            if any(request_path == excluded.rstrip("/") for excluded in EXCLUDE_PATHS):
+                return await call_next(request)
+
+            payload = AuthorizationMiddleware.verify_access_token(self, request.headers)
+            request.state.user = payload
+            request.state.auth_user_id = payload.get("user_id")
+            return await call_next(request)
+
+        except UnauthorizedException as exc:
+            error_response = exc.to_dict()
+            error_response["path"] = request.url.path
+            error_response["type"] = exc.__class__.__name__
+            error_response["timestamp"] = datetime.now(UTC).isoformat()
+            return JSONResponse(content=error_response, status_code=exc.status_code)
+
+
+def make_app(middleware_class: type) -> FastAPI:
+    """Create the application with ``middleware_class`` as authorization middleware."""
+    application = create_application()
+    if middleware_class is AuthorizationMiddleware:
+        return application
+    application.user_middleware = [
+        Middleware(middleware_class) if item.cls is AuthorizationMiddleware else item
+        for item in application.user_middleware
+    ]
+    return application
+
+
+async def requests_per_second(
+    application: FastAPI, path: str, headers: dict, count: int, concurrency: int
+) -> float:
+    """Send ``count`` GET requests, ``concurrency`` at a time, and get the throughput."""
+    transport = httpx.ASGITransport(app=application)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        response = await client.get(path, headers=headers)
+        response.raise_for_status()
+
+        async def worker(requests: int) -> None:
+            for _ in range(requests):
+                await client.get(path, headers=headers)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(count // concurrency) for _ in range(concurrency)))
+        return (count // concurrency) * concurrency / (time.perf_counter() - started)
+
+
+async def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=5000, help="requests per measurement")
+    parser.add_argument("--concurrency", type=int, default=10, help="requests in flight")
+    args = parser.parse_args()
+
+    # Serve the user detail route from the cache
+    user_id = str(uuid.uuid4())
+    user = {"id": user_id, "name": "Bench", "email": "bench@example.com", "status": "active"}
+    await user_cache.set(user_id, user)
+    await user_cache.set(f"{user_id}:etag", make_etag("user", user_id, None))
+
+    token = create_access_token({"user_id": user_id, "email": user["email"]})
+    headers = {"Authorization": f"Bearer {token}"}
+    routes = {"/health/": {}, f"/api/v1/users/{user_id}": headers}
+
+    for path, route_headers in routes.items():
+        results = {}
+        for middleware_class in (BaseHTTPAuthorizationMiddleware, AuthorizationMiddleware):
+            results[middleware_class.__name__] = await requests_per_second(
+                make_app(middleware_class), path, route_headers, args.requests, args.concurrency
+            )
+        baseline, asgi = results.values()
+        label = "/api/v1/users/{id}" if route_headers else path
+        print(  # noqa: T201
+            f"{label:<22} BaseHTTPMiddleware {baseline:8.0f} req/s   "
+            f"pure ASGI {asgi:8.0f} req/s   {asgi / baseline:4.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
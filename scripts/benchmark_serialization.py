@@ -0,0 +1,79 @@
+"""
+Micro-benchmark of the user serialization paths, no database needed.
+
+Compares the validated path (``get_serialize_data(UserSerializer, user.as_dict())``) with
+the trusted path of ``app.lib.serialization`` for single users and for pages of users.
+
+    uv run python scripts/benchmark_serialization.py --users 100 --rounds 2000
+"""
+
+import argparse
+import sys
+import timeit
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from fastapi_pundra.rest.helpers import get_serialize_data
+
+from app.lib.serialization import trusted_dump, trusted_dump_list
+from app.models.users import User
+from app.serializers.user_serializer import UserSerializer
+
+
+def make_users(count: int) -> list[User]:
+    """Build transient users like the ones loaded from the database."""
+    return [
+        User(
+            id=uuid.uuid4(),
+            name=f"User {i}",
+            email=f"user{i}@example.com",
+            password="$2b$12$" + "x" * 53,
+            status="active",
+        )
+        for i in range(count)
+    ]
+
+
+def bench(label: str, func: object, rounds: int, baseline: float | None = None) -> float:
+    """Time ``func`` and print the time per call."""
+    seconds = min(timeit.repeat(func, number=rounds, repeat=5)) / rounds
+    speedup = f"  {baseline / seconds:5.1f}x" if baseline else ""
+    print(f"{label:<44} {seconds * 1e6:10.2f} us{speedup}")  # noqa: T201
+    return seconds
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--users", type=int, default=100, help="users per page")
+    parser.add_argument("--rounds", type=int, default=2000, help="calls per measurement")
+    args = parser.parse_args()
+
+    users = make_users(args.users)
+    user = users[0]
+
+    baseline = bench(
+        "single: get_serialize_data(as_dict())",
+        lambda: get_serialize_data(UserSerializer, user.as_dict()),
+        args.rounds,
+    )
+    bench("single: trusted_dump", lambda: trusted_dump(UserSerializer, user), args.rounds, baseline)
+
+    page_rounds = max(args.rounds // args.users, 1)
+    baseline = bench(
+        f"page of {args.users}: model_validate + model_dump",
+        lambda: [UserSerializer.model_validate(item).model_dump() for item in users],
+        page_rounds,
+    )
+    bench(
+        f"page of {args.users}: trusted_dump_list",
+        lambda: trusted_dump_list(UserSerializer, users),
+        page_rounds,
+        baseline,
+    )
+
+
+if __name__ == "__main__":
+    main()